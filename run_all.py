@@ -2,10 +2,9 @@
 Master ETL Orchestrator Script
 
 Runs the complete ETL pipeline in sequence:
-1. Extract and transform raw data
-2. Validate data quality
-3. Load processed data into SQLite
-4. Update state tracking for incremental loads
+1. Extract and transform raw data (records incremental watermarks)
+2. Load processed data into SQLite
+3. Validate data quality
 
 Usage:
     python run_all.py [--full] [--validate-only]
@@ -23,9 +22,9 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.pipeline import run_pipeline
-from src.validation import validate_all, load_processed_tables
+from src.validation import validate_processed
 from src.config import PROCESSED_DIR
-from src.incremental import update_run_timestamp, should_run_full_load
+from src.incremental import should_run_full_load
 from src.logger_config import get_logger, get_log_file_path
 
 logger = get_logger(__name__)
@@ -42,28 +41,64 @@ def load_to_sqlite():
     
     try:
         import pandas as pd
-        from sqlalchemy import create_engine
-        
+        from sqlalchemy import create_engine, text
+
         db_path = Path(__file__).parent / "ecommerce.db"
         engine = create_engine(f"sqlite:///{db_path}")
-        
+
         logger.info(f"SQLite DB path: {db_path}")
-        
-        # Load and insert processed tables
+
+        # Load and insert processed tables. The load phase writes
+        # Parquet by default, so enumerate those first and only fall
+        # back to a CSV when no Parquet exists for that table
         processed_dir = PROCESSED_DIR
-        csv_files = list(processed_dir.glob("*.csv"))
-        
-        for csv_file in csv_files:
-            table_name = csv_file.stem
-            logger.info(f"Loading {table_name} into database...")
-            
-            df = pd.read_csv(csv_file)
-            df.to_sql(table_name, con=engine, if_exists='replace', index=False)
-            
-            logger.info(f"  ✓ {table_name}: {len(df)} rows inserted")
-        
+        data_files = {f.stem: f for f in processed_dir.glob("*.csv")}
+        data_files.update({f.stem: f for f in processed_dir.glob("*.parquet")})
+
+        with engine.connect() as conn:
+            # Durability is irrelevant during a full rebuild - skip fsyncs
+            # and the rollback journal, and batch all inserts into one
+            # transaction
+            conn.execute(text("PRAGMA synchronous=OFF"))
+            conn.execute(text("PRAGMA journal_mode=OFF"))
+            # Close the transaction SQLAlchemy 2.0 autobegins on the
+            # first execute, or the explicit begin() below raises
+            conn.commit()
+
+            with conn.begin():
+                for table_name, data_file in sorted(data_files.items()):
+                    logger.info(f"Loading {table_name} into database...")
+
+                    # Parquet decodes numeric columns far faster than CSV
+                    if data_file.suffix == ".parquet":
+                        df = pd.read_parquet(data_file)
+                    else:
+                        df = pd.read_csv(data_file)
+
+                    # chunksize stays under SQLite's bind-variable cap
+                    # (32766) for multi-row VALUES inserts
+                    df.to_sql(table_name, con=conn, if_exists='replace',
+                              index=False, method='multi', chunksize=2000)
+
+                    logger.info(f"  ✓ {table_name}: {len(df)} rows inserted")
+
         logger.info("✓ SQLite load completed")
-        
+
+        # Rebuild the mv_* dashboard rollups: app.py prefers them and
+        # only falls back to live queries when they're missing, so
+        # leaving the old ones in place would serve stale KPIs and
+        # revenue numbers after this refresh
+        from initialize_streamlit import build_dashboard_rollups
+        logger.info("Rebuilding dashboard rollup tables...")
+        build_dashboard_rollups(engine)
+        logger.info("✓ Dashboard rollups rebuilt")
+
+        # Invalidate the dashboard's init sentinel: the Streamlit app
+        # skips its own rebuild while the sentinel exists, and the data
+        # underneath it just changed
+        sentinel = Path(__file__).parent / ".initialized"
+        sentinel.unlink(missing_ok=True)
+
     except ImportError as e:
         logger.error(f"Required package not found: {e}")
         logger.info("Skipping SQLite load. Install sqlalchemy and pandas to enable.")
@@ -107,14 +142,11 @@ def main():
             load_to_sqlite()
         
         # Step 3: Validate processed data
+        # (state tracking is persisted by run_pipeline itself, which
+        # records the real per-table watermarks)
         logger.info("\nRunning data quality validation...")
-        processed_tables = load_processed_tables(PROCESSED_DIR)
-        validation_passed = validate_all(processed_tables, fail_on_error=False)
-        
-        # Step 4: Update state tracking
-        if not args.validate_only:
-            update_run_timestamp(table_states={})
-        
+        validation_passed = validate_processed(PROCESSED_DIR, fail_on_error=False)
+
         # Final summary
         logger.info("\n" + "=" * 70)
         if validation_passed:
@@ -15,6 +15,45 @@ ORDER_ITEMS_CSV = RAW_DIR / "order_items.csv"
 EVENTS_CSV      = RAW_DIR / "events.csv"
 REVIEWS_CSV     = RAW_DIR / "reviews.csv"
 
+# Known raw CSV schemas. Passing dtypes and date columns into read_csv
+# lets the C parser skip the type-inference pass and parse dates while
+# reading instead of boxing them as strings. Numeric columns are left to
+# the parser on purpose: raw feeds may contain bad values that the staging
+# phase coerces with errors='coerce'.
+SCHEMAS = {
+    "users": {
+        "dtype": {"user_id": "string", "name": "string", "email": "string",
+                  "gender": "string", "city": "string"},
+        "parse_dates": ["signup_date"],
+    },
+    "products": {
+        "dtype": {"product_id": "string", "product_name": "string",
+                  "category": "string", "brand": "string"},
+        "parse_dates": [],
+    },
+    "orders": {
+        "dtype": {"order_id": "string", "user_id": "string",
+                  "order_status": "string"},
+        "parse_dates": ["order_date"],
+    },
+    "order_items": {
+        "dtype": {"order_item_id": "string", "order_id": "string",
+                  "product_id": "string", "user_id": "string"},
+        "parse_dates": [],
+    },
+    "events": {
+        "dtype": {"event_id": "string", "user_id": "string",
+                  "product_id": "string", "event_type": "string"},
+        "parse_dates": ["event_timestamp"],
+    },
+    "reviews": {
+        "dtype": {"review_id": "string", "order_id": "string",
+                  "product_id": "string", "user_id": "string",
+                  "review_text": "string"},
+        "parse_dates": ["review_date"],
+    },
+}
+
 # Processed / output file paths
 DIM_USERS_CSV         = PROCESSED_DIR / "dim_users.csv"
 DIM_PRODUCTS_CSV      = PROCESSED_DIR / "dim_products.csv"
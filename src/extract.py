@@ -2,7 +2,10 @@
 Extract phase: Load raw CSV files.
 Handles errors gracefully and logs detailed information about data loaded.
 """
+import logging
+
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from . import config
 from .logger_config import get_logger, log_context
@@ -10,17 +13,19 @@ from .logger_config import get_logger, log_context
 logger = get_logger(__name__)
 
 
-def load_csv_safe(filepath: Path, table_name: str) -> pd.DataFrame:
+def load_csv_safe(filepath: Path, table_name: str, schema: dict = None) -> pd.DataFrame:
     """
     Safely load a CSV file with error handling.
-    
+
     Args:
         filepath: Path to CSV file
         table_name: Name of the table (for logging)
-    
+        schema: Optional dict with 'dtype' and 'parse_dates' for read_csv,
+                so the parser skips type inference (see config.SCHEMAS)
+
     Returns:
         DataFrame or empty DataFrame if file not found
-    
+
     Raises:
         Exception: If CSV is corrupted or unreadable (after logging)
     """
@@ -28,8 +33,13 @@ def load_csv_safe(filepath: Path, table_name: str) -> pd.DataFrame:
         if not filepath.exists():
             logger.warning(f"File not found: {filepath}")
             return pd.DataFrame()
-        
-        df = pd.read_csv(filepath)
+
+        schema = schema or {}
+        df = pd.read_csv(
+            filepath,
+            dtype=schema.get("dtype"),
+            parse_dates=schema.get("parse_dates") or None,
+        )
         logger.debug(f"  Loaded {table_name}: {filepath}")
         return df
     
@@ -44,7 +54,7 @@ def load_csv_safe(filepath: Path, table_name: str) -> pd.DataFrame:
 def load_users():
     """Load users table with error handling and logging."""
     with log_context(logger, "load_users", source="users.csv"):
-        df = load_csv_safe(config.USERS_CSV, "users")
+        df = load_csv_safe(config.USERS_CSV, "users", config.SCHEMAS["users"])
         logger.info(f"✓ Loaded {len(df)} users")
         return df
 
@@ -52,7 +62,7 @@ def load_users():
 def load_products():
     """Load products table with error handling and logging."""
     with log_context(logger, "load_products", source="products.csv"):
-        df = load_csv_safe(config.PRODUCTS_CSV, "products")
+        df = load_csv_safe(config.PRODUCTS_CSV, "products", config.SCHEMAS["products"])
         logger.info(f"✓ Loaded {len(df)} products")
         return df
 
@@ -60,7 +70,7 @@ def load_products():
 def load_orders():
     """Load orders table with error handling and logging."""
     with log_context(logger, "load_orders", source="orders.csv"):
-        df = load_csv_safe(config.ORDERS_CSV, "orders")
+        df = load_csv_safe(config.ORDERS_CSV, "orders", config.SCHEMAS["orders"])
         logger.info(f"✓ Loaded {len(df)} orders")
         return df
 
@@ -68,7 +78,7 @@ def load_orders():
 def load_order_items():
     """Load order items table with error handling and logging."""
     with log_context(logger, "load_order_items", source="order_items.csv"):
-        df = load_csv_safe(config.ORDER_ITEMS_CSV, "order_items")
+        df = load_csv_safe(config.ORDER_ITEMS_CSV, "order_items", config.SCHEMAS["order_items"])
         logger.info(f"✓ Loaded {len(df)} order items")
         return df
 
@@ -76,7 +86,7 @@ def load_order_items():
 def load_events():
     """Load events table with error handling and logging."""
     with log_context(logger, "load_events", source="events.csv"):
-        df = load_csv_safe(config.EVENTS_CSV, "events")
+        df = load_csv_safe(config.EVENTS_CSV, "events", config.SCHEMAS["events"])
         logger.info(f"✓ Loaded {len(df)} events")
         return df
 
@@ -84,11 +94,28 @@ def load_events():
 def load_reviews():
     """Load reviews table with error handling and logging."""
     with log_context(logger, "load_reviews", source="reviews.csv"):
-        df = load_csv_safe(config.REVIEWS_CSV, "reviews")
+        df = load_csv_safe(config.REVIEWS_CSV, "reviews", config.SCHEMAS["reviews"])
         logger.info(f"✓ Loaded {len(df)} reviews")
         return df
 
 
+# Loader per raw table; also the entry points for the streaming
+# per-table pipeline in pipeline.py
+LOADERS = {
+    "users": load_users,
+    "products": load_products,
+    "orders": load_orders,
+    "order_items": load_order_items,
+    "events": load_events,
+    "reviews": load_reviews,
+}
+
+
+def load_one(table_name: str) -> pd.DataFrame:
+    """Load a single raw table by name."""
+    return LOADERS[table_name]()
+
+
 def load_all_raw():
     """
     Load all raw tables with comprehensive error handling.
@@ -99,25 +126,25 @@ def load_all_raw():
     logger.info("=" * 60)
     
     try:
-        raw_data = {
-            "users": load_users(),
-            "products": load_products(),
-            "orders": load_orders(),
-            "order_items": load_order_items(),
-            "events": load_events(),
-            "reviews": load_reviews(),
-        }
-        
-        # Log summary statistics
+        # pandas' C parser releases the GIL, so the six reads overlap on
+        # both I/O and parsing when run from a thread pool
+        with ThreadPoolExecutor(max_workers=len(LOADERS)) as executor:
+            futures = {name: executor.submit(loader) for name, loader in LOADERS.items()}
+            raw_data = {name: future.result() for name, future in futures.items()}
+
+        # Log summary statistics. The full NULL count is an O(rows × cols)
+        # scan of every table, so only pay for it when DEBUG logging is on;
+        # staging re-checks the columns that actually matter anyway.
         logger.info("\nExtract Summary:")
         for table_name, df in raw_data.items():
             total_rows = len(df)
             total_cols = len(df.columns)
-            null_count = df.isnull().sum().sum()
-            if null_count > 0:
-                logger.warning(f"  {table_name}: {total_rows} rows × {total_cols} cols | {null_count} NULL values found")
-            else:
-                logger.debug(f"  {table_name}: {total_rows} rows × {total_cols} cols")
+            if logger.isEnabledFor(logging.DEBUG):
+                null_count = df.isnull().sum().sum()
+                if null_count > 0:
+                    logger.warning(f"  {table_name}: {total_rows} rows × {total_cols} cols | {null_count} NULL values found")
+                else:
+                    logger.debug(f"  {table_name}: {total_rows} rows × {total_cols} cols")
         
         logger.info("Extract phase completed successfully")
         return raw_data
@@ -2,22 +2,35 @@
 Incremental load tracking and state management.
 Tracks last run timestamp to support incremental data loads.
 """
+import functools
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 from .logger_config import get_logger
 
+# Optional C-based JSON codec; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 # State file location
 STATE_FILE = Path(__file__).resolve().parents[1] / ".etl_state.json"
 
 
+@functools.lru_cache(maxsize=1)
 def get_last_run_timestamp() -> Dict[str, Any]:
     """
     Load the last run state from disk.
-    
+
+    The parsed state is memoized for the life of the process - the
+    incremental filters ask for it once per table, and only
+    update_run_timestamp changes it (which clears the cache).
+
     Returns:
         Dict with keys like 'last_run', 'orders_last_date', 'events_last_timestamp', etc.
     """
@@ -26,8 +39,8 @@ def get_last_run_timestamp() -> Dict[str, Any]:
         return {"last_run": None, "tables": {}}
     
     try:
-        with open(STATE_FILE, 'r') as f:
-            state = json.load(f)
+        raw = STATE_FILE.read_bytes()
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
         logger.debug(f"Loaded state from {STATE_FILE}")
         return state
     except Exception as e:
@@ -50,8 +63,17 @@ def update_run_timestamp(table_states: Optional[Dict[str, Any]] = None):
     }
     
     try:
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(state, indent=2).encode('utf-8')
+
+        # Write to a sibling temp file and rename into place so a crash
+        # mid-write can never leave a truncated state file behind
+        tmp_file = STATE_FILE.with_suffix('.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, STATE_FILE)
+        get_last_run_timestamp.cache_clear()
         logger.info(f"Updated state file with timestamp: {now}")
     except Exception as e:
         logger.error(f"Failed to update state file: {e}")
@@ -79,6 +101,10 @@ def get_incremental_filter(table_name: str, date_column: Optional[str] = None):
     last_processed = table_state.get("last_date")
     
     if last_processed:
+        # Lazy import: pandas costs ~300ms at startup and this is the only
+        # place the module needs it
+        import pandas as pd
+
         logger.info(f"  {table_name}: Incremental load since {last_processed}")
         return pd.Timestamp(last_processed)
     else:
@@ -86,13 +112,22 @@ def get_incremental_filter(table_name: str, date_column: Optional[str] = None):
         return None
 
 
+def watermark(series) -> Dict[str, Any]:
+    """
+    Build a per-table state entry from the max of a date column.
+
+    Returns an empty dict (meaning "full load next run") when the
+    column is empty or all-NaT.
+    """
+    ts = series.max()
+    if ts is None or ts != ts:  # NaT/NaN compare unequal to themselves
+        return {}
+    return {"last_date": ts.isoformat()}
+
+
 def should_run_full_load() -> bool:
     """
     Determine if a full load should be run (first time or forced).
     """
     state = get_last_run_timestamp()
     return state["last_run"] is None
-
-
-# Import pandas for timestamp operations
-import pandas as pd
@@ -3,18 +3,19 @@ Logging configuration for ETL pipeline.
 Logs to both console and file for audit trail and debugging.
 Provides production-grade logging with error handling and context tracking.
 """
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
-from datetime import datetime
 from contextlib import contextmanager
 
 # Ensure logs directory exists
 LOGS_DIR = Path(__file__).resolve().parents[1] / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
-# Create log file with timestamp
-LOG_FILE = LOGS_DIR / f"etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+# One rolling log file instead of a new timestamped file per import:
+# bounded disk usage under frequent runs, and a single shared target
+LOG_FILE = LOGS_DIR / "etl.log"
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -48,12 +49,25 @@ def get_logger(name: str) -> logging.Logger:
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
-    # File handler (DEBUG level - more detailed for debugging)
-    file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
+    # File handler (DEBUG level - more detailed for debugging), rotating
+    # at 10 MB with 5 backups and wrapped in a MemoryHandler so records
+    # are batched into one write() instead of a syscall per log line;
+    # errors and shutdown flush immediately
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=10_000_000, backupCount=5, encoding='utf-8'
+    )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
+
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    logger.addHandler(memory_handler)
+    atexit.register(memory_handler.flush)
+
     return logger
 
 
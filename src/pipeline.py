@@ -1,23 +1,71 @@
 """
 Main ETL Pipeline Orchestrator.
 Coordinates extract, transform, and load stages with comprehensive error handling.
+
+Each table streams through its own extract → stage → build → merge →
+save pipeline and is released as soon as its file is written, so peak
+memory holds one generation of each table instead of the raw, staged
+and warehouse dicts all at once.
 """
-from . import extract, transform_staging, transform_warehouse, load, config
-from .logger_config import get_logger
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import extract, incremental, transform_staging, transform_warehouse, load, config
+from .logger_config import get_logger, log_summary
 
 logger = get_logger(__name__)
 
+# Per-table pipeline: warehouse table name, staging function, builder
+TABLE_PIPELINES = {
+    "users": ("dim_users", transform_staging.stage_users, transform_warehouse.build_dim_users),
+    "products": ("dim_products", transform_staging.stage_products, transform_warehouse.build_dim_products),
+    "orders": ("fact_orders", transform_staging.stage_orders, transform_warehouse.build_fact_orders),
+    "order_items": ("fact_order_items", transform_staging.stage_order_items, transform_warehouse.build_fact_order_items),
+    "events": ("fact_events", transform_staging.stage_events, transform_warehouse.build_fact_events),
+    "reviews": ("fact_reviews", transform_staging.stage_reviews, transform_warehouse.build_fact_reviews),
+}
+
+# Date column used to record each table's incremental watermark
+WATERMARK_COLUMNS = {
+    "users": "signup_date",
+    "orders": "order_date",
+    "events": "event_timestamp",
+    "reviews": "review_date",
+}
+
+
+def _run_table(name: str, merge_previous: bool):
+    """
+    Run one table end to end: extract → stage → build → merge → save.
+
+    Returns (name, warehouse_name, save_detail, watermark_state); the
+    frame itself is dropped here so memory is reclaimed per table.
+    """
+    wh_name, stage_fn, build_fn = TABLE_PIPELINES[name]
+
+    df = build_fn(stage_fn(extract.load_one(name)))
+
+    # On incremental runs the staged frame only holds new rows, so
+    # union it with the previously materialized output
+    if merge_previous:
+        df = transform_warehouse.merge_one(wh_name, df, config.PROCESSED_DIR)
+
+    detail = load.save_one(wh_name, df, config.PROCESSED_DIR)
+
+    wm_col = WATERMARK_COLUMNS.get(name)
+    state = incremental.watermark(df[wm_col]) if wm_col else None
+    return name, wh_name, detail, state
+
 
 def run_pipeline():
     """
     Execute the complete ETL pipeline with error handling.
-    
-    Stages:
-    1. Extract: Load raw data from CSV files
+
+    Per table:
+    1. Extract: Load raw data from CSV
     2. Transform Staging: Clean and standardize data
     3. Transform Warehouse: Build dimensional and fact tables
-    4. Load: Save processed data to CSV files
-    
+    4. Load: Save processed data (Parquet, CSV fallback)
+
     Raises:
         Exception: If any stage fails (with detailed logging)
     """
@@ -25,36 +73,39 @@ def run_pipeline():
         logger.info("\n" + "=" * 60)
         logger.info("STARTING ETL PIPELINE")
         logger.info("=" * 60)
-        
-        # 1. Extract
-        logger.info("\n→ STAGE 1: EXTRACT")
-        raw = extract.load_all_raw()
-        logger.info(f"✓ Extract complete: {len(raw)} tables loaded")
-
-        # 2. Transform – staging/cleaning
-        logger.info("\n→ STAGE 2: TRANSFORM STAGING")
-        stg = transform_staging.stage_all(raw)
-        logger.info(f"✓ Staging complete: {len(stg)} tables staged")
-
-        # 3. Transform – warehouse: dims & facts
-        logger.info("\n→ STAGE 3: TRANSFORM WAREHOUSE")
-        wh = transform_warehouse.build_warehouse(stg)
-        logger.info(f"✓ Warehouse build complete: {len(wh)} tables created")
-
-        # 4. Load – save processed tables to CSV
-        logger.info("\n→ STAGE 4: LOAD")
-        load.save_as_csv(wh, config.PROCESSED_DIR)
-        logger.info(f"✓ Load complete: All tables saved")
+
+        merge_previous = not incremental.should_run_full_load()
+
+        table_states = {}
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(TABLE_PIPELINES)) as executor:
+            futures = {
+                executor.submit(_run_table, name, merge_previous): name
+                for name in TABLE_PIPELINES
+            }
+            for future in as_completed(futures):
+                name, wh_name, detail, state = future.result()
+                results[wh_name] = detail
+                if state is not None:
+                    table_states[name] = state
+
+        log_summary(logger, "Pipeline Output", {
+            wh_name: results[wh_name] for wh_name, _, _ in TABLE_PIPELINES.values()
+        })
+
+        # Record per-table watermarks so the next run only stages rows
+        # newer than what was just materialized
+        incremental.update_run_timestamp(table_states)
 
         logger.info("=" * 60)
         logger.info("✅ ETL PIPELINE COMPLETED SUCCESSFULLY")
         logger.info(f"Processed tables saved in: {config.PROCESSED_DIR}")
         logger.info("=" * 60 + "\n")
-        
+
     except KeyError as e:
         logger.error(f"❌ Data structure error (missing table/column): {e}", exc_info=True)
         raise
-    
+
     except Exception as e:
         logger.error(f"❌ Pipeline failed: {type(e).__name__}: {e}", exc_info=True)
         logger.error("Pipeline execution halted. Check logs above for details.")
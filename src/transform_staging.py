@@ -1,17 +1,97 @@
 """
 Transform Staging Phase: Clean and standardize raw data.
 Logs all transformations, dropped rows, and data quality warnings.
+
+The stage_* functions operate on the caller's frames without a defensive
+copy: column assignments build new Series anyway, and stage_all consumes
+the raw dict so nothing reads the inputs afterwards. This keeps one table
+generation in memory instead of two during staging.
 """
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
-from .logger_config import get_logger, log_context
+from .incremental import get_incremental_filter
+from .logger_config import get_logger, log_context, log_summary
 
 logger = get_logger(__name__)
 
 
+def normalize_text(series: pd.Series, case: str = None) -> pd.Series:
+    """
+    Normalize a low-cardinality text column through its unique values.
+
+    Strips (and optionally re-cases) only the distinct values, then maps
+    them back onto the column and stores it as a category - O(unique)
+    string work instead of O(rows), which matters for columns like
+    event_type with a few dozen values across millions of rows.
+    NaN stays NaN instead of becoming the string 'nan'.
+    """
+    cats = pd.Index(series.dropna().unique())
+    normalized = cats.astype(str).str.strip()
+    if case == 'title':
+        normalized = normalized.str.title()
+    elif case == 'lower':
+        normalized = normalized.str.lower()
+    mapping = dict(zip(cats, normalized))
+    return series.map(mapping).astype('category')
+
+
+def arrow_strings(series: pd.Series) -> pd.Series:
+    """Convert a high-cardinality text column to Arrow-backed strings
+    so .str operations run vectorized in C instead of per Python object."""
+    try:
+        return series.astype('string[pyarrow]')
+    except (ImportError, TypeError):
+        return series.astype('string')
+
+
+
+def _apply_incremental_filter(df: pd.DataFrame, table_name: str, date_col: str) -> pd.DataFrame:
+    """
+    Keep only rows newer than the last recorded watermark for a table.
+
+    Runs right after date coercion so the comparison is Timestamp vs
+    datetime64; on a first run (or missing state) the filter is None
+    and the full frame passes through.
+    """
+    since = get_incremental_filter(table_name, date_col)
+    if since is None:
+        return df
+    before = len(df)
+    df = df.loc[df[date_col] > since]
+    logger.debug(f"  {table_name}: incremental filter kept {len(df)}/{before} rows (> {since})")
+    return df
+
+
+def _dedup_by_id(df: pd.DataFrame, col: str):
+    """
+    Drop rows whose id appeared earlier, keeping the first occurrence.
+
+    Integer id columns go through np.unique(return_index=True), which
+    sorts one contiguous ndarray instead of building a hashmap sized
+    for the whole frame; other dtypes fall back to the hash-based
+    duplicated() mask. Returns (deduped_df, dropped_count).
+    """
+    before = len(df)
+    ids = df[col].to_numpy()
+    if np.issubdtype(ids.dtype, np.integer):
+        _, idx = np.unique(ids, return_index=True)
+        if len(idx) != before:
+            df = df.iloc[np.sort(idx)]
+        return df, before - len(idx)
+
+    dup_mask = df[col].duplicated()
+    dropped = int(dup_mask.sum())
+    if dropped:
+        df = df.loc[~dup_mask]
+    return df, dropped
+
+
 def stage_users(df_users: pd.DataFrame) -> pd.DataFrame:
     """Stage users: convert dates, normalize text, remove duplicates."""
     with log_context(logger, "stage_users"):
-        df = df_users.copy()
+        df = df_users
         before_count = len(df)
         
         # Track transformations
@@ -19,92 +99,90 @@ def stage_users(df_users: pd.DataFrame) -> pd.DataFrame:
         if null_user_ids > 0:
             logger.warning(f"  Found {null_user_ids} NULL user_ids (will cause issues)")
         
-        df['signup_date'] = pd.to_datetime(df['signup_date'], errors='coerce')
+        df['signup_date'] = pd.to_datetime(df['signup_date'], errors='coerce', format='ISO8601', cache=True)
         bad_dates = df['signup_date'].isna().sum()
         if bad_dates > 0:
             logger.warning(f"  {bad_dates} invalid signup dates converted to NaT")
         
-        df['gender'] = df['gender'].astype(str).str.strip().str.title()
-        df['city'] = df['city'].astype(str).str.strip()
+        df = _apply_incremental_filter(df, 'users', 'signup_date')
+        
+        df['gender'] = normalize_text(df['gender'], case='title')
+        df['city'] = arrow_strings(df['city']).str.strip()
         
-        before_dedup = len(df)
-        df = df.drop_duplicates(subset='user_id')
-        dropped = before_dedup - len(df)
+        df, dropped = _dedup_by_id(df, 'user_id')
         
-        logger.info(f"  Users: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
+        logger.debug(f"  Users: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
         return df
 
 
 def stage_products(df_products: pd.DataFrame) -> pd.DataFrame:
     """Stage products: convert numeric types, normalize text, remove duplicates."""
     with log_context(logger, "stage_products"):
-        df = df_products.copy()
+        df = df_products
         before_count = len(df)
         
         null_product_ids = df['product_id'].isna().sum()
         if null_product_ids > 0:
             logger.warning(f"  Found {null_product_ids} NULL product_ids (will cause issues)")
         
-        df['price'] = pd.to_numeric(df['price'], errors='coerce')
+        df['price'] = pd.to_numeric(df['price'], errors='coerce', downcast='float')
         bad_prices = df['price'].isna().sum()
         if bad_prices > 0:
             logger.warning(f"  {bad_prices} invalid prices converted to NaN")
         
         if 'rating' in df.columns:
-            df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
+            df['rating'] = pd.to_numeric(df['rating'], errors='coerce', downcast='float')
         
-        df['category'] = df['category'].astype(str).str.strip()
-        df['brand'] = df['brand'].astype(str).str.strip()
+        df['category'] = normalize_text(df['category'])
+        df['brand'] = normalize_text(df['brand'])
         
-        before_dedup = len(df)
-        df = df.drop_duplicates(subset='product_id')
-        dropped = before_dedup - len(df)
+        df, dropped = _dedup_by_id(df, 'product_id')
         
-        logger.info(f"  Products: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
+        logger.debug(f"  Products: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
         return df
 
 
 def stage_orders(df_orders: pd.DataFrame) -> pd.DataFrame:
     """Stage orders: convert dates and numerics, normalize text, remove duplicates."""
     with log_context(logger, "stage_orders"):
-        df = df_orders.copy()
+        df = df_orders
         before_count = len(df)
         
         null_order_ids = df['order_id'].isna().sum()
         if null_order_ids > 0:
             logger.warning(f"  Found {null_order_ids} NULL order_ids (will cause issues)")
         
-        df['order_date'] = pd.to_datetime(df['order_date'], errors='coerce')
+        df['order_date'] = pd.to_datetime(df['order_date'], errors='coerce', format='ISO8601', cache=True)
         bad_dates = df['order_date'].isna().sum()
         if bad_dates > 0:
             logger.warning(f"  {bad_dates} invalid order dates converted to NaT")
         
-        df['order_status'] = df['order_status'].astype(str).str.strip().str.lower()
-        df['total_amount'] = pd.to_numeric(df['total_amount'], errors='coerce')
+        df = _apply_incremental_filter(df, 'orders', 'order_date')
+        
+        df['order_status'] = normalize_text(df['order_status'], case='lower')
+        df['total_amount'] = pd.to_numeric(df['total_amount'], errors='coerce', downcast='float')
         bad_amounts = df['total_amount'].isna().sum()
         if bad_amounts > 0:
             logger.warning(f"  {bad_amounts} invalid amounts converted to NaN")
         
-        before_dedup = len(df)
-        df = df.drop_duplicates(subset='order_id')
-        dropped = before_dedup - len(df)
+        df, dropped = _dedup_by_id(df, 'order_id')
         
-        logger.info(f"  Orders: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
+        logger.debug(f"  Orders: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
         return df
 
 
 def stage_order_items(df_order_items: pd.DataFrame) -> pd.DataFrame:
     """Stage order items: convert numerics, calculate totals, remove duplicates."""
     with log_context(logger, "stage_order_items"):
-        df = df_order_items.copy()
+        df = df_order_items
         before_count = len(df)
         
         null_order_item_ids = df['order_item_id'].isna().sum()
         if null_order_item_ids > 0:
             logger.warning(f"  Found {null_order_item_ids} NULL order_item_ids (will cause issues)")
         
-        df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce')
-        df['item_price'] = pd.to_numeric(df['item_price'], errors='coerce')
+        df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce', downcast='integer')
+        df['item_price'] = pd.to_numeric(df['item_price'], errors='coerce', downcast='float')
         
         bad_qty = df['quantity'].isna().sum()
         bad_price = df['item_price'].isna().sum()
@@ -112,66 +190,64 @@ def stage_order_items(df_order_items: pd.DataFrame) -> pd.DataFrame:
             logger.warning(f"  {bad_qty} bad quantities, {bad_price} bad prices")
         
         if 'item_total' in df.columns:
-            df['item_total'] = pd.to_numeric(df['item_total'], errors='coerce')
+            df['item_total'] = pd.to_numeric(df['item_total'], errors='coerce', downcast='float')
         
-        before_dedup = len(df)
-        df = df.drop_duplicates(subset='order_item_id')
-        dropped = before_dedup - len(df)
+        df, dropped = _dedup_by_id(df, 'order_item_id')
         
-        logger.info(f"  Order Items: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
+        logger.debug(f"  Order Items: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
         return df
 
 
 def stage_events(df_events: pd.DataFrame) -> pd.DataFrame:
     """Stage events: convert timestamps, normalize event types, remove duplicates."""
     with log_context(logger, "stage_events"):
-        df = df_events.copy()
+        df = df_events
         before_count = len(df)
         
         null_event_ids = df['event_id'].isna().sum()
         if null_event_ids > 0:
             logger.warning(f"  Found {null_event_ids} NULL event_ids (will cause issues)")
         
-        df['event_timestamp'] = pd.to_datetime(df['event_timestamp'], errors='coerce')
+        df['event_timestamp'] = pd.to_datetime(df['event_timestamp'], errors='coerce', format='ISO8601', cache=True)
         bad_ts = df['event_timestamp'].isna().sum()
         if bad_ts > 0:
             logger.warning(f"  {bad_ts} invalid timestamps converted to NaT")
         
-        df['event_type'] = df['event_type'].astype(str).str.strip().str.lower()
+        df = _apply_incremental_filter(df, 'events', 'event_timestamp')
         
-        before_dedup = len(df)
-        df = df.drop_duplicates(subset='event_id')
-        dropped = before_dedup - len(df)
+        df['event_type'] = normalize_text(df['event_type'], case='lower')
         
-        logger.info(f"  Events: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
+        df, dropped = _dedup_by_id(df, 'event_id')
+        
+        logger.debug(f"  Events: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
         return df
 
 
 def stage_reviews(df_reviews: pd.DataFrame) -> pd.DataFrame:
     """Stage reviews: convert ratings and dates, remove duplicates."""
     with log_context(logger, "stage_reviews"):
-        df = df_reviews.copy()
+        df = df_reviews
         before_count = len(df)
         
         null_review_ids = df['review_id'].isna().sum()
         if null_review_ids > 0:
             logger.warning(f"  Found {null_review_ids} NULL review_ids (will cause issues)")
         
-        df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
+        df['rating'] = pd.to_numeric(df['rating'], errors='coerce', downcast='float')
         bad_ratings = df['rating'].isna().sum()
         if bad_ratings > 0:
             logger.warning(f"  {bad_ratings} invalid ratings converted to NaN")
         
-        df['review_date'] = pd.to_datetime(df['review_date'], errors='coerce')
+        df['review_date'] = pd.to_datetime(df['review_date'], errors='coerce', format='ISO8601', cache=True)
         bad_dates = df['review_date'].isna().sum()
         if bad_dates > 0:
             logger.warning(f"  {bad_dates} invalid review dates converted to NaT")
         
-        before_dedup = len(df)
-        df = df.drop_duplicates(subset='review_id')
-        dropped = before_dedup - len(df)
+        df = _apply_incremental_filter(df, 'reviews', 'review_date')
+        
+        df, dropped = _dedup_by_id(df, 'review_id')
         
-        logger.info(f"  Reviews: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
+        logger.debug(f"  Reviews: {before_count} → {len(df)} rows (dropped {dropped} duplicates)")
         return df
 
 
@@ -182,15 +258,31 @@ def stage_all(raw: dict) -> dict:
     logger.info("=" * 60)
     
     try:
-        staged = {
-            "users": stage_users(raw["users"]),
-            "products": stage_products(raw["products"]),
-            "orders": stage_orders(raw["orders"]),
-            "order_items": stage_order_items(raw["order_items"]),
-            "events": stage_events(raw["events"]),
-            "reviews": stage_reviews(raw["reviews"]),
+        stages = {
+            "users": stage_users,
+            "products": stage_products,
+            "orders": stage_orders,
+            "order_items": stage_order_items,
+            "events": stage_events,
+            "reviews": stage_reviews,
         }
-        
+
+        # The six tables are disjoint, and the heavy parts of staging
+        # (to_datetime, to_numeric, hashing for duplicated) release the
+        # GIL, so stage them in parallel threads. Popping the raw frame
+        # at submit time keeps the memory contract: each raw table is
+        # reclaimed as soon as its staged replacement exists.
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {
+                name: executor.submit(stage_fn, raw.pop(name))
+                for name, stage_fn in stages.items()
+            }
+            staged = {name: future.result() for name, future in futures.items()}
+
+        # One batched summary instead of a lock/format cycle per table
+        # (the per-table detail lines still land in the debug log)
+        log_summary(logger, "Staging Row Counts", {name: len(df) for name, df in staged.items()})
+
         logger.info("Transform staging phase completed successfully")
         return staged
     
@@ -2,10 +2,20 @@
 Data validation and quality checks for ETL pipeline.
 Validates processed tables against business rules and data integrity constraints.
 """
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from .logger_config import get_logger
 
+# Dask is an optional out-of-core engine for tables larger than RAM;
+# without it the chunked streaming validator covers the same case
+try:
+    import dask.dataframe as dd
+except ImportError:
+    dd = None
+
 logger = get_logger(__name__)
 
 
@@ -14,24 +24,68 @@ class ValidationError(Exception):
     pass
 
 
-def check_null_primary_keys(tables: dict) -> dict:
+# Primary key column per warehouse table, shared by the PK and FK checks
+PK_MAP = {
+    "dim_users": "user_id",
+    "dim_products": "product_id",
+    "fact_orders": "order_id",
+    "fact_order_items": "order_item_id",
+    "fact_events": "event_id",
+    "fact_reviews": "review_id",
+}
+
+# (table, column, invalid-value predicate), shared by the in-memory
+# and streaming numeric checks. The predicates are phrased as "is
+# invalid" rather than "is valid" because NaN compares False in < and
+# <=, so counting invalid rows is one comparison plus one
+# count_nonzero - no separate isnan mask to build and combine
+_NUMERIC_RULES = [
+    ("dim_products", "price", lambda x: x < 0),
+    ("fact_orders", "total_amount", lambda x: x < 0),
+    ("fact_order_items", "quantity", lambda x: x <= 0),
+    ("fact_order_items", "item_price", lambda x: x < 0),
+]
+
+# Parent key count above which the FK probe switches from a hashtable
+# to a sorted binary search (the hashtable stops fitting in cache)
+_SORT_MERGE_THRESHOLD = 1_000_000
+
+
+def _build_pk_cache(tables: dict) -> dict:
+    """
+    Scan each primary-key column once and cache what the checks need.
+
+    check_null_primary_keys reads 'null_count' and
+    check_referential_integrity uses 'index' as the probe haystack, so
+    each PK column is walked a single time per validation run instead
+    of once per check. The haystack is a pd.Index rather than a numpy
+    array or Python set: the Index lazily builds a C-level hashtable on
+    its first probe and keeps it, so rules sharing a parent (dim_users
+    backs both fact_orders and fact_events) hash the parent only once.
+    """
+    cache = {}
+    for table_name, pk_col in PK_MAP.items():
+        if table_name not in tables or pk_col not in tables[table_name].columns:
+            continue
+        series = tables[table_name][pk_col]
+        cache[table_name] = {
+            "index": pd.Index(series.dropna().unique()),
+            # hasnans short-circuits the usual all-valid case without
+            # allocating a boolean mask
+            "null_count": int(series.isna().sum()) if series.hasnans else 0,
+        }
+    return cache
+
+
+def check_null_primary_keys(tables: dict, pk_cache: dict = None) -> dict:
     """
     Verify that primary keys have no NULL values.
     Returns dict with table names and null counts.
     """
     logger.info("Validating primary keys for NULL values...")
     results = {}
-    
-    pk_map = {
-        "dim_users": "user_id",
-        "dim_products": "product_id",
-        "fact_orders": "order_id",
-        "fact_order_items": "order_item_id",
-        "fact_events": "event_id",
-        "fact_reviews": "review_id",
-    }
-    
-    for table_name, pk_col in pk_map.items():
+
+    for table_name, pk_col in PK_MAP.items():
         if table_name not in tables:
             continue
         
@@ -41,7 +95,14 @@ def check_null_primary_keys(tables: dict) -> dict:
             results[table_name] = -1
             continue
         
-        null_count = df[pk_col].isna().sum()
+        if pk_cache and table_name in pk_cache:
+            null_count = pk_cache[table_name]["null_count"]
+        elif not df[pk_col].hasnans:
+            # Short-circuit the usual all-valid case: hasnans avoids
+            # materializing a full boolean mask just to sum zeros
+            null_count = 0
+        else:
+            null_count = int(df[pk_col].isna().to_numpy().sum())
         results[table_name] = null_count
         
         if null_count > 0:
@@ -52,7 +113,7 @@ def check_null_primary_keys(tables: dict) -> dict:
     return results
 
 
-def check_referential_integrity(tables: dict) -> dict:
+def check_referential_integrity(tables: dict, pk_cache: dict = None) -> dict:
     """
     Verify referential integrity: foreign keys reference existing primary keys.
     """
@@ -93,6 +154,10 @@ def check_referential_integrity(tables: dict) -> dict:
         },
     ]
     
+    # Ad-hoc parent indexes (parent key not in the shared PK cache),
+    # reused across rules within this run
+    parent_indexes = {}
+
     for rule in fk_rules:
         child = rule["child_table"]
         parent = rule["parent_table"]
@@ -110,12 +175,57 @@ def check_referential_integrity(tables: dict) -> dict:
             logger.warning(f"  Skipping {child}.{fk} → {parent}.{pk} (column not found)")
             continue
         
-        # Check for orphaned records
-        child_fk_values = child_df[fk].dropna().unique()
-        parent_pk_values = parent_df[pk].unique()
-        
-        orphaned = set(child_fk_values) - set(parent_pk_values)
-        orphan_count = len(orphaned)
+        # Check for orphaned records by probing a pd.Index built from
+        # the parent keys - the Index materializes its C-level hashtable
+        # on first probe and caches it, so no per-value boxing into
+        # Python sets and no re-hashing when a later rule reuses the
+        # same parent. The shared PK cache already holds the Index when
+        # the parent key is the table's primary key.
+        if pk_cache and parent in pk_cache and PK_MAP.get(parent) == pk:
+            parent_index = pk_cache[parent]["index"]
+        elif (parent, pk) in parent_indexes:
+            parent_index = parent_indexes[(parent, pk)]
+        else:
+            parent_index = pd.Index(parent_df[pk].drop_duplicates().to_numpy())
+            parent_indexes[(parent, pk)] = parent_index
+
+        child_fk_series = child_df[fk]
+        if pd.api.types.is_object_dtype(child_fk_series) or pd.api.types.is_string_dtype(child_fk_series):
+            # Factorize-then-probe for string keys: hash each string
+            # exactly once into a shared integer code space. Parent
+            # values come first and are already unique, so they take
+            # codes 0..n_parent-1 and any child code beyond that range
+            # is an orphan - no second hash pass needed.
+            combined = pd.concat(
+                [pd.Series(parent_index), child_fk_series.dropna()],
+                ignore_index=True,
+            )
+            codes, _ = pd.factorize(combined, sort=False)
+            n_parent = len(parent_index)
+            orphan_count = int((codes[n_parent:] >= n_parent).sum())
+        elif len(parent_index) > _SORT_MERGE_THRESHOLD:
+            # Sort-merge fallback for huge parents: a hashtable over
+            # millions of keys no longer fits in L3, so every probe is
+            # a random-access cache miss. Binary search over a sorted
+            # key array is pure C with far better locality. Probes past
+            # the largest key clip onto the last slot and then fail the
+            # equality test, so they count as orphans correctly.
+            parent_sorted = np.sort(parent_index.to_numpy())
+            child_vals = child_fk_series.dropna().to_numpy()
+            pos = np.searchsorted(parent_sorted, child_vals)
+            np.clip(pos, 0, len(parent_sorted) - 1, out=pos)
+            orphan_count = int(np.count_nonzero(parent_sorted[pos] != child_vals))
+        elif parent_index.is_unique:
+            # Unique-key specialization: get_indexer probes a one-slot-
+            # per-key table (no duplicate buckets), so the lookup is a
+            # single C pass with a smaller, cache-friendlier hashtable
+            # than the general isin machinery. -1 means "not found";
+            # nulls are dropped first so they don't count as orphans.
+            indexer = parent_index.get_indexer(child_fk_series.dropna())
+            orphan_count = int((indexer == -1).sum())
+        else:
+            orphan_mask = child_fk_series.notna() & ~child_fk_series.isin(parent_index)
+            orphan_count = int(orphan_mask.sum())
         
         key = f"{child}.{fk} → {parent}.{pk}"
         results[key] = orphan_count
@@ -155,11 +265,18 @@ def check_date_ranges(tables: dict) -> dict:
             results[table_name] = -1
             continue
         
-        # Convert to datetime if not already
-        df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-        
-        # Check for future dates
-        future_dates = (df[date_col] > today).sum()
+        # Convert only when needed - Parquet-loaded tables are already
+        # datetime64, so re-parsing would be a wasted O(n) pass. Bind to
+        # a local instead of writing back: validators must not change
+        # the caller's dtypes
+        if pd.api.types.is_datetime64_any_dtype(df[date_col]):
+            dates = df[date_col]
+        else:
+            dates = pd.to_datetime(df[date_col], errors='coerce')
+
+        # Check for future dates on the raw numpy buffer; NaT compares
+        # False, so no separate null mask is needed
+        future_dates = int((dates.to_numpy() > today.to_datetime64()).sum())
         results[table_name] = future_dates
         
         if future_dates > 0:
@@ -177,14 +294,7 @@ def check_numeric_ranges(tables: dict) -> dict:
     logger.info("Validating numeric ranges (no negative prices/amounts)...")
     results = {}
     
-    checks = [
-        ("dim_products", "price", lambda x: x >= 0),
-        ("fact_orders", "total_amount", lambda x: x >= 0),
-        ("fact_order_items", "quantity", lambda x: x > 0),
-        ("fact_order_items", "item_price", lambda x: x >= 0),
-    ]
-    
-    for table_name, col, condition in checks:
+    for table_name, col, invalid in _NUMERIC_RULES:
         if table_name not in tables:
             continue
         
@@ -193,8 +303,15 @@ def check_numeric_ranges(tables: dict) -> dict:
             logger.warning(f"  {table_name}: column '{col}' not found")
             continue
         
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-        invalid_count = (~condition(df[col]) & df[col].notna()).sum()
+        # Convert only when needed (into a local - validators must not
+        # change the caller's dtypes), then test the raw numpy buffer
+        if pd.api.types.is_numeric_dtype(df[col]):
+            values = df[col]
+        else:
+            values = pd.to_numeric(df[col], errors='coerce')
+        # Single SIMD comparison + popcount pass; NaN rows fall out of
+        # the comparison on their own
+        invalid_count = int(np.count_nonzero(invalid(values.to_numpy())))
         
         key = f"{table_name}.{col}"
         results[key] = invalid_count
@@ -223,66 +340,421 @@ def validate_all(tables: dict, fail_on_error: bool = False) -> bool:
     logger.info("=" * 60)
     
     all_passed = True
+
+    # One pass over each PK column, shared by the PK and FK checks
+    pk_cache = _build_pk_cache(tables)
+
+    # The four checks read disjoint columns and never mutate their
+    # inputs, and isin/to_datetime/reductions release the GIL - so run
+    # them concurrently. A -1 (missing column) never trips a failure.
+    checks = [
+        ("Primary key", lambda: check_null_primary_keys(tables, pk_cache)),
+        ("Referential integrity", lambda: check_referential_integrity(tables, pk_cache)),
+        ("Date range", lambda: check_date_ranges(tables)),
+        ("Numeric range", lambda: check_numeric_ranges(tables)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(name, executor.submit(fn)) for name, fn in checks]
+        for name, future in futures:
+            try:
+                results = future.result()
+                if any(count > 0 for count in results.values()):
+                    all_passed = False
+            except Exception as e:
+                logger.error(f"{name} validation failed: {e}")
+                all_passed = False
     
-    try:
-        pk_results = check_null_primary_keys(tables)
-        if any(count > 0 for count in pk_results.values() if count >= 0):
-            all_passed = False
-    except Exception as e:
-        logger.error(f"Primary key validation failed: {e}")
-        all_passed = False
-    
-    try:
-        fk_results = check_referential_integrity(tables)
-        if any(count > 0 for count in fk_results.values()):
-            all_passed = False
-    except Exception as e:
-        logger.error(f"Referential integrity validation failed: {e}")
-        all_passed = False
+    logger.info("=" * 60)
+    if all_passed:
+        logger.info("✅ ALL VALIDATION CHECKS PASSED")
+    else:
+        logger.warning("⚠️  SOME VALIDATION CHECKS FAILED - Review logs above")
+    logger.info("=" * 60 + "\n")
     
-    try:
-        date_results = check_date_ranges(tables)
-        if any(count > 0 for count in date_results.values() if count >= 0):
-            all_passed = False
-    except Exception as e:
-        logger.error(f"Date range validation failed: {e}")
-        all_passed = False
+    if fail_on_error and not all_passed:
+        raise ValidationError("Data validation failed. Check logs for details.")
     
-    try:
-        numeric_results = check_numeric_ranges(tables)
-        if any(count > 0 for count in numeric_results.values()):
+    return all_passed
+
+
+# SQL predicates mirroring the pandas validators, used by validate_all_sql
+_SQL_FK_RULES = [
+    ("fact_orders", "user_id", "dim_users", "user_id"),
+    ("fact_order_items", "order_id", "fact_orders", "order_id"),
+    ("fact_order_items", "product_id", "dim_products", "product_id"),
+    ("fact_events", "user_id", "dim_users", "user_id"),
+    ("fact_reviews", "product_id", "dim_products", "product_id"),
+]
+
+_SQL_DATE_COLUMNS = {
+    "dim_users": "signup_date",
+    "fact_orders": "order_date",
+    "fact_events": "event_timestamp",
+    "fact_reviews": "review_date",
+}
+
+_SQL_NUMERIC_RULES = [
+    ("dim_products", "price", "price < 0"),
+    ("fact_orders", "total_amount", "total_amount < 0"),
+    ("fact_order_items", "quantity", "quantity <= 0"),
+    ("fact_order_items", "item_price", "item_price < 0"),
+]
+
+
+def validate_all_sql(engine, fail_on_error: bool = False) -> bool:
+    """
+    Run the validation checks inside SQLite instead of pandas.
+
+    Once the warehouse tables are loaded into the database, every check
+    is one aggregate query over indexed columns - no CSV parsing and no
+    DataFrames in memory. Semantics match validate_all; use the pandas
+    path when no engine is available.
+
+    Args:
+        engine: SQLAlchemy engine bound to the warehouse database
+        fail_on_error: If True, raise ValidationError on any failure
+
+    Returns:
+        True if all checks pass, False otherwise
+    """
+    logger.info("\n" + "=" * 60)
+    logger.info("DATA QUALITY VALIDATION (SQL)")
+    logger.info("=" * 60)
+
+    all_passed = True
+
+    with engine.connect() as conn:
+        def _scalar(sql):
+            return conn.exec_driver_sql(sql).scalar()
+
+        # Table → set of columns, so missing tables/columns are skipped
+        # with a warning like the pandas validators do
+        existing = {}
+        for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='table'"):
+            existing[row[0]] = {
+                col[1] for col in conn.exec_driver_sql(f"PRAGMA table_info({row[0]})")
+            }
+
+        def _has(table, col):
+            return table in existing and col in existing[table]
+
+        # Index every PK so the anti-joins below probe a btree instead
+        # of scanning the parent per child row
+        for table_name, pk_col in PK_MAP.items():
+            if _has(table_name, pk_col):
+                conn.exec_driver_sql(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{pk_col} "
+                    f"ON {table_name}({pk_col})"
+                )
+
+        logger.info("Validating primary keys for NULL values...")
+        for table_name, pk_col in PK_MAP.items():
+            if not _has(table_name, pk_col):
+                continue
+            null_count = _scalar(f"SELECT COUNT(*) FROM {table_name} WHERE {pk_col} IS NULL")
+            if null_count > 0:
+                logger.error(f"  ❌ {table_name}: {null_count} NULL values in primary key '{pk_col}'")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {table_name}: primary key has no NULL values")
+
+        logger.info("Validating referential integrity...")
+        for child, fk, parent, pk in _SQL_FK_RULES:
+            if not _has(child, fk) or not _has(parent, pk):
+                logger.warning(f"  Skipping {child}.{fk} → {parent}.{pk} (table or column not found)")
+                continue
+            orphan_count = _scalar(
+                f"SELECT COUNT(*) FROM {child} c "
+                f"LEFT JOIN {parent} p ON c.{fk} = p.{pk} "
+                f"WHERE p.{pk} IS NULL AND c.{fk} IS NOT NULL"
+            )
+            key = f"{child}.{fk} → {parent}.{pk}"
+            if orphan_count > 0:
+                logger.error(f"  ❌ {key}: {orphan_count} orphaned records found")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {key}: all foreign keys are valid")
+
+        logger.info("Validating date ranges (no future dates)...")
+        for table_name, date_col in _SQL_DATE_COLUMNS.items():
+            if not _has(table_name, date_col):
+                continue
+            future_dates = _scalar(
+                f"SELECT COUNT(*) FROM {table_name} WHERE {date_col} > datetime('now')"
+            )
+            if future_dates > 0:
+                logger.error(f"  ❌ {table_name}: {future_dates} records with future dates in '{date_col}'")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {table_name}: all dates are within valid range")
+
+        logger.info("Validating numeric ranges (no negative prices/amounts)...")
+        for table_name, col, predicate in _SQL_NUMERIC_RULES:
+            if not _has(table_name, col):
+                continue
+            invalid_count = _scalar(
+                f"SELECT COUNT(*) FROM {table_name} WHERE {predicate} AND {col} IS NOT NULL"
+            )
+            key = f"{table_name}.{col}"
+            if invalid_count > 0:
+                logger.error(f"  ❌ {key}: {invalid_count} invalid values (outside valid range)")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {key}: all values are within valid range")
+
+    logger.info("=" * 60)
+    if all_passed:
+        logger.info("✅ ALL VALIDATION CHECKS PASSED")
+    else:
+        logger.warning("⚠️  SOME VALIDATION CHECKS FAILED - Review logs above")
+    logger.info("=" * 60 + "\n")
+
+    if fail_on_error and not all_passed:
+        raise ValidationError("Data validation failed. Check logs for details.")
+
+    return all_passed
+
+
+def validate_all_streaming(processed_dir: Path, chunksize: int = 200_000,
+                           fail_on_error: bool = False) -> bool:
+    """
+    Validate processed CSVs in fixed-size chunks.
+
+    Memory stays constant regardless of table size: the PK-null, date
+    and numeric rules reduce per chunk, and the FK checks pre-load only
+    the parent key columns (dimension-sized) before streaming each
+    child table through an isin probe chunk by chunk. Use this instead
+    of validate_all when the tables don't comfortably fit in RAM.
+    """
+    logger.info("\n" + "=" * 60)
+    logger.info("DATA QUALITY VALIDATION (STREAMING)")
+    logger.info("=" * 60)
+
+    all_passed = True
+    csv_files = {p.stem: p for p in processed_dir.glob("*.csv")}
+
+    # Load just the parent key columns - dimensions are small
+    parent_keys = {}
+    for _child, _fk, parent, pk in _SQL_FK_RULES:
+        if parent in csv_files and parent not in parent_keys:
+            try:
+                col = pd.read_csv(csv_files[parent], usecols=[pk])[pk]
+                parent_keys[parent] = col.dropna().unique()
+            except ValueError:
+                logger.warning(f"  {parent}: key column '{pk}' not found")
+
+    from datetime import datetime
+    today = pd.Timestamp(datetime.now().date()).to_datetime64()
+
+    for table_name, path in csv_files.items():
+        pk_col = PK_MAP.get(table_name)
+        date_col = _SQL_DATE_COLUMNS.get(table_name)
+        num_rules = [(c, cond) for t, c, cond in _NUMERIC_RULES if t == table_name]
+        fk_rules = [
+            (fk, parent, pk) for child, fk, parent, pk in _SQL_FK_RULES
+            if child == table_name and parent in parent_keys
+        ]
+        if not (pk_col or date_col or num_rules or fk_rules):
+            continue
+
+        pk_nulls = 0
+        future_dates = 0
+        num_invalid = {col: 0 for col, _ in num_rules}
+        fk_orphans = {fk: 0 for fk, _, _ in fk_rules}
+
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            if pk_col and pk_col in chunk.columns and chunk[pk_col].hasnans:
+                pk_nulls += int(chunk[pk_col].isna().to_numpy().sum())
+            if date_col and date_col in chunk.columns:
+                dates = pd.to_datetime(chunk[date_col], errors='coerce')
+                future_dates += int((dates.to_numpy() > today).sum())
+            for col, invalid in num_rules:
+                if col in chunk.columns:
+                    arr = pd.to_numeric(chunk[col], errors='coerce').to_numpy()
+                    num_invalid[col] += int(np.count_nonzero(invalid(arr)))
+            for fk, parent, _pk in fk_rules:
+                if fk in chunk.columns:
+                    mask = chunk[fk].notna() & ~chunk[fk].isin(parent_keys[parent])
+                    fk_orphans[fk] += int(mask.sum())
+
+        if pk_col:
+            if pk_nulls > 0:
+                logger.error(f"  ❌ {table_name}: {pk_nulls} NULL values in primary key '{pk_col}'")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {table_name}: primary key has no NULL values")
+        if date_col:
+            if future_dates > 0:
+                logger.error(f"  ❌ {table_name}: {future_dates} records with future dates in '{date_col}'")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {table_name}: all dates are within valid range")
+        for col, count in num_invalid.items():
+            if count > 0:
+                logger.error(f"  ❌ {table_name}.{col}: {count} invalid values (outside valid range)")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {table_name}.{col}: all values are within valid range")
+        for fk, count in fk_orphans.items():
+            if count > 0:
+                logger.error(f"  ❌ {table_name}.{fk}: {count} orphaned records found")
+                all_passed = False
+            else:
+                logger.info(f"  ✓ {table_name}.{fk}: all foreign keys are valid")
+
+    logger.info("=" * 60)
+    if all_passed:
+        logger.info("✅ ALL VALIDATION CHECKS PASSED")
+    else:
+        logger.warning("⚠️  SOME VALIDATION CHECKS FAILED - Review logs above")
+    logger.info("=" * 60 + "\n")
+
+    if fail_on_error and not all_passed:
+        raise ValidationError("Data validation failed. Check logs for details.")
+
+    return all_passed
+
+
+# Per-file size above which tables no longer load fully into memory for
+# validation and an out-of-core engine takes over
+_OUT_OF_CORE_THRESHOLD = 500 * 1024 * 1024
+
+
+def _validate_dask(processed_dir: Path, fail_on_error: bool = False) -> bool:
+    """
+    Out-of-core validation on Dask's threaded scheduler.
+
+    Dimension key columns are loaded as small in-memory pandas objects;
+    everything else is expressed as a lazy reduction over dask frames
+    and evaluated in one dd.compute() call, so each CSV is scanned once
+    with all cores busy.
+    """
+    logger.info("\n" + "=" * 60)
+    logger.info("DATA QUALITY VALIDATION (DASK)")
+    logger.info("=" * 60)
+
+    csv_files = {p.stem: p for p in processed_dir.glob("*.csv")}
+
+    # Parent key columns are dimension-sized - keep them in pandas
+    parent_keys = {}
+    for _child, _fk, parent, pk in _SQL_FK_RULES:
+        if parent in csv_files and parent not in parent_keys:
+            col = pd.read_csv(csv_files[parent], usecols=[pk])[pk]
+            parent_keys[parent] = col.dropna().unique()
+
+    from datetime import datetime
+    today = pd.Timestamp(datetime.now().date())
+
+    labels = []
+    lazy = []
+    for table_name, path in csv_files.items():
+        ddf = dd.read_csv(path, assume_missing=True)
+
+        pk_col = PK_MAP.get(table_name)
+        if pk_col and pk_col in ddf.columns:
+            labels.append((f"{table_name}", f"NULL values in primary key '{pk_col}'",
+                           "primary key has no NULL values"))
+            lazy.append(ddf[pk_col].isna().sum())
+
+        date_col = _SQL_DATE_COLUMNS.get(table_name)
+        if date_col and date_col in ddf.columns:
+            labels.append((f"{table_name}", f"records with future dates in '{date_col}'",
+                           "all dates are within valid range"))
+            dates = dd.to_datetime(ddf[date_col], errors='coerce')
+            lazy.append((dates > today).sum())
+
+        for t, col, invalid in _NUMERIC_RULES:
+            if t == table_name and col in ddf.columns:
+                labels.append((f"{table_name}.{col}", "invalid values (outside valid range)",
+                               "all values are within valid range"))
+                values = dd.to_numeric(ddf[col], errors='coerce')
+                lazy.append(invalid(values).sum())
+
+        for child, fk, parent, _pk in _SQL_FK_RULES:
+            if child == table_name and fk in ddf.columns and parent in parent_keys:
+                labels.append((f"{table_name}.{fk}", "orphaned records found",
+                               "all foreign keys are valid"))
+                lazy.append((ddf[fk].notnull() & ~ddf[fk].isin(parent_keys[parent])).sum())
+
+    counts = dd.compute(*lazy)
+
+    all_passed = True
+    for (key, bad_msg, ok_msg), count in zip(labels, counts):
+        if int(count) > 0:
+            logger.error(f"  ❌ {key}: {int(count)} {bad_msg}")
             all_passed = False
-    except Exception as e:
-        logger.error(f"Numeric range validation failed: {e}")
-        all_passed = False
-    
+        else:
+            logger.info(f"  ✓ {key}: {ok_msg}")
+
     logger.info("=" * 60)
     if all_passed:
         logger.info("✅ ALL VALIDATION CHECKS PASSED")
     else:
         logger.warning("⚠️  SOME VALIDATION CHECKS FAILED - Review logs above")
     logger.info("=" * 60 + "\n")
-    
+
     if fail_on_error and not all_passed:
         raise ValidationError("Data validation failed. Check logs for details.")
-    
+
     return all_passed
 
 
+def validate_processed(processed_dir: Path, fail_on_error: bool = False) -> bool:
+    """
+    Validate processed outputs, picking an engine by table size.
+
+    Tables comfortably under _OUT_OF_CORE_THRESHOLD load fully and run
+    through validate_all. When any CSV exceeds it, the run switches to
+    an out-of-core engine - Dask when installed, otherwise the chunked
+    streaming reader - so validation also works on tables larger than
+    RAM.
+    """
+    oversized = [
+        p.name for p in processed_dir.glob("*.csv")
+        if p.stat().st_size > _OUT_OF_CORE_THRESHOLD
+    ]
+    if not oversized:
+        tables = load_processed_tables(processed_dir)
+        return validate_all(tables, fail_on_error=fail_on_error)
+
+    logger.info(f"Large tables detected ({', '.join(oversized)}) - using out-of-core validation")
+    if dd is not None:
+        return _validate_dask(processed_dir, fail_on_error=fail_on_error)
+    logger.info("dask not installed - falling back to chunked streaming validation")
+    return validate_all_streaming(processed_dir, fail_on_error=fail_on_error)
+
+
 def load_processed_tables(processed_dir: Path) -> dict:
     """
-    Load all processed CSV files from the processed directory.
+    Load all processed tables from the processed directory.
+
+    Parquet files are preferred - they round-trip the dtypes the ETL
+    wrote, so the validators skip re-inference entirely. CSVs (older
+    runs, or the pyarrow-less fallback path) are parsed with the
+    multithreaded pyarrow engine when available.
     """
     logger.info(f"Loading processed tables from {processed_dir}")
-    
+
+    def _read(path: Path) -> pd.DataFrame:
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path)
+        try:
+            return pd.read_csv(path, engine="pyarrow")
+        except (ImportError, ValueError):
+            return pd.read_csv(path)
+
+    # Parquet wins when both formats exist for a table
+    files = {p.stem: p for p in processed_dir.glob("*.csv")}
+    files.update({p.stem: p for p in processed_dir.glob("*.parquet")})
+
     tables = {}
-    csv_files = processed_dir.glob("*.csv")
-    
-    for csv_file in csv_files:
-        table_name = csv_file.stem
-        df = pd.read_csv(csv_file)
-        tables[table_name] = df
-        logger.debug(f"  Loaded {table_name}: {len(df)} rows")
-    
+    if files:
+        # Both readers release the GIL, so the per-file loads overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            futures = {name: executor.submit(_read, path) for name, path in files.items()}
+            for name, future in futures.items():
+                tables[name] = future.result()
+                logger.debug(f"  Loaded {name}: {len(tables[name])} rows")
+
     logger.info(f"✓ Loaded {len(tables)} tables")
     return tables
@@ -1,12 +1,32 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from sqlalchemy import create_engine, text
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import os
 
+# DuckDB is an optional columnar engine for dashboard reads: it scans
+# the Parquet files directly with vectorized aggregates and only reads
+# the referenced columns, where row-oriented SQLite reads every row
+# byte. SQLite remains the default and the fallback.
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# st.dataframe serializes every payload to Arrow IPC for the frontend;
+# when query results are already pyarrow-backed, Streamlit ships the
+# existing buffers instead of copying each cell out of numpy first
+try:
+    import pyarrow  # noqa: F401
+    _SQL_READ_KWARGS = {'dtype_backend': 'pyarrow'}
+except ImportError:
+    _SQL_READ_KWARGS = {}
+
 # Page Configuration - Must be first
 st.set_page_config(
     page_title="E-Commerce Analytics Dashboard",
@@ -15,66 +35,433 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load CSV data directly into memory as fallback
+# Known string and date columns per processed table. Declaring them up
+# front lets the CSV reader skip its type-inference pass and parse
+# dates while reading; numeric columns are left to the parser. Mirrors
+# the SCHEMAS pattern used for raw files in src/config.py.
+_CSV_SCHEMAS = {
+    'dim_users': ({'user_id': 'string', 'name': 'string', 'email': 'string',
+                   'gender': 'string', 'city': 'string'}, ['signup_date']),
+    'dim_products': ({'product_id': 'string', 'product_name': 'string',
+                      'category': 'string', 'brand': 'string'}, []),
+    'fact_orders': ({'order_id': 'string', 'user_id': 'string',
+                     'order_status': 'string'}, ['order_date']),
+    'fact_order_items': ({'order_item_id': 'string', 'order_id': 'string',
+                          'product_id': 'string', 'user_id': 'string'}, []),
+    'fact_events': ({'event_id': 'string', 'user_id': 'string',
+                     'product_id': 'string', 'event_type': 'string'},
+                    ['event_timestamp', 'event_date']),
+    'fact_reviews': ({'review_id': 'string', 'order_id': 'string',
+                      'product_id': 'string', 'user_id': 'string'},
+                     ['review_date']),
+}
+
+# Columns no dashboard query or rollup touches. Projecting them out at
+# read time shrinks every downstream scan; review_text and email are
+# the heavy ones, the rest are ETL-derived keys recomputed on demand.
+_EXCLUDED_COLUMNS = {
+    'dim_users': ['email', 'signup_year', 'signup_month'],
+    'fact_reviews': ['review_text'],
+    'fact_events': ['event_hour'],
+}
+
+# Numeric columns narrowed after load. float32 keeps cents-level
+# precision through these revenue sums (results are rounded to 2dp for
+# display anyway) and halves the bytes every groupby scan moves.
+_DOWNCAST_COLUMNS = {
+    'dim_products': {'price': 'float32', 'rating': 'float32'},
+    'fact_orders': {'total_amount': 'float32'},
+    'fact_order_items': {'quantity': 'int32', 'item_price': 'float32',
+                         'item_total': 'float32'},
+    'fact_reviews': {'rating': 'float32'},
+}
+
+# Low-cardinality string columns that get grouped and counted
+# repeatedly. As category dtype their groupbys run over integer codes
+# instead of hashing Python strings, and each distinct value is stored
+# once rather than per row.
+_CATEGORICAL_COLUMNS = {
+    'dim_users': ['gender', 'city'],
+    'dim_products': ['category', 'brand'],
+    'fact_orders': ['order_status'],
+    'fact_events': ['event_type'],
+}
+
+def _csv_read_kwargs(csv_file, table_name):
+    """Build read_csv dtype/parse_dates kwargs from the declared schema,
+    filtered to the columns actually present so a drifted file doesn't
+    fail the read outright."""
+    dtype, parse_dates = _CSV_SCHEMAS.get(table_name, ({}, []))
+    excluded = _EXCLUDED_COLUMNS.get(table_name, [])
+    header = [c for c in pd.read_csv(csv_file, nrows=0).columns
+              if c not in excluded]
+    return {
+        'dtype': {c: t for c, t in dtype.items() if c in header},
+        'parse_dates': [c for c in parse_dates if c in header],
+        'usecols': header,
+    }
+
+def read_processed_table(processed_dir, table_name):
+    """Read one processed table, preferring Parquet over CSV.
+
+    Parquet round-trips the dtypes the ETL wrote and loads several
+    times faster; the CSV fallback uses the multithreaded pyarrow
+    parser when available, with the known schema passed in so the
+    parser skips type inference."""
+    parquet_file = processed_dir / f'{table_name}.parquet'
+    excluded = _EXCLUDED_COLUMNS.get(table_name, [])
+    if parquet_file.exists():
+        try:
+            # Project the unused columns out inside the Parquet reader
+            # so their pages are never decoded
+            import pyarrow.parquet as pq
+            names = pq.read_schema(parquet_file).names
+            df = pd.read_parquet(
+                parquet_file, columns=[c for c in names if c not in excluded])
+        except ImportError:
+            df = pd.read_parquet(parquet_file)
+            df = df.drop(columns=[c for c in excluded if c in df.columns])
+    else:
+        csv_file = processed_dir / f'{table_name}.csv'
+        if not csv_file.exists():
+            return pd.DataFrame()
+        kwargs = _csv_read_kwargs(csv_file, table_name)
+        try:
+            df = pd.read_csv(csv_file, engine='pyarrow', **kwargs)
+        except (ImportError, ValueError):
+            df = pd.read_csv(csv_file, **kwargs)
+        # One-shot conversion: leave a Parquet sibling behind so the
+        # next cold start takes the fast branch above instead of
+        # re-parsing CSV
+        try:
+            df.to_parquet(parquet_file, index=False)
+        except (ImportError, OSError):
+            pass
+    for column in _CATEGORICAL_COLUMNS.get(table_name, []):
+        if column in df:
+            df[column] = df[column].astype('category')
+    for column, dtype in _DOWNCAST_COLUMNS.get(table_name, {}).items():
+        if column in df:
+            try:
+                df[column] = df[column].astype(dtype)
+            except (ValueError, TypeError):
+                # Unexpected nulls or text - keep the wider dtype
+                pass
+    return df
+
+# Load processed tables on demand as fallback
 @st.cache_data
-def load_csv_data():
-    """Load all CSV files directly into memory"""
+def load_table(table_name):
+    """Load one processed table into memory (cached after first use)"""
     processed_dir = Path(__file__).parent / 'Data' / 'Processed'
-    data = {}
-    
-    tables = [
-        'dim_products', 'dim_users', 'fact_orders', 
+    try:
+        return read_processed_table(processed_dir, table_name)
+    except Exception as e:
+        st.error(f"Error loading {table_name}: {e}")
+        return pd.DataFrame()
+
+class _TableStore:
+    """Lazy mapping over the processed tables.
+
+    Quacks like the old eager csv_data dict, but each table loads (and
+    caches) on first access, so the landing page never parses the five
+    tables it doesn't read."""
+    _TABLES = frozenset([
+        'dim_products', 'dim_users', 'fact_orders',
         'fact_order_items', 'fact_reviews', 'fact_events'
-    ]
-    
-    for table_name in tables:
-        csv_file = processed_dir / f'{table_name}.csv'
-        if csv_file.exists():
-            try:
-                data[table_name] = pd.read_csv(csv_file)
-            except Exception as e:
-                st.error(f"Error loading {table_name}: {e}")
-                data[table_name] = pd.DataFrame()
-        else:
-            data[table_name] = pd.DataFrame()
-    
-    return data
+    ])
+
+    def __init__(self):
+        # Tables this store has handed out so far; lets peek() answer
+        # "already in memory?" without triggering a load
+        self._materialized = {}
+
+    def __contains__(self, table_name):
+        return table_name in self._TABLES
+
+    def __getitem__(self, table_name):
+        if table_name not in self._TABLES:
+            raise KeyError(table_name)
+        df = load_table(table_name)
+        self._materialized[table_name] = df
+        return df
+
+    def get(self, table_name, default=None):
+        if table_name not in self._TABLES:
+            return default
+        return self[table_name]
+
+    def peek(self, table_name):
+        """A table's frame if already materialized this run, else None.
+
+        Never loads: callers that only want to reuse what's in memory
+        (not pay for a parse) must not defeat the store's laziness."""
+        return self._materialized.get(table_name)
 
 # Initialize database from CSV files
 @st.cache_resource
 def get_database_engine():
-    """Initialize database from CSV files - always rebuild"""
+    """Initialize database from CSV files, reusing a finished build"""
     db_path = Path(__file__).parent / 'ecommerce.db'
     processed_dir = Path(__file__).parent / 'Data' / 'Processed'
-    
+    sentinel = Path(__file__).parent / '.initialized'
+    engine = None
+    loaded_count = 0
+
     try:
-        from sqlalchemy import create_engine, inspect
-        
+        from sqlalchemy import create_engine
+
         # Create engine with absolute path for better compatibility
         db_path_str = str(db_path.absolute())
         engine = create_engine(f'sqlite:///{db_path_str}')
-        
-        # Always rebuild tables from CSV (ephemeral on Streamlit Cloud)
+
+        # A completed build leaves a sentinel beside the database. When
+        # both survived (warm container restart rather than a fresh
+        # deploy), reuse the database as-is - no table scans, no
+        # sqlite_master round-trip. ETL runs delete the sentinel so the
+        # next start rebuilds from the fresh CSVs.
+        if sentinel.exists() and db_path.exists():
+            return engine
+
+        # Rebuild tables from CSV (ephemeral on Streamlit Cloud)
         tables = [
             'dim_products', 'dim_users', 'fact_orders',
             'fact_order_items', 'fact_reviews', 'fact_events'
         ]
         
-        loaded_count = 0
-        for table_name in tables:
-            csv_file = processed_dir / f'{table_name}.csv'
-            if csv_file.exists():
-                try:
-                    df = pd.read_csv(csv_file)
-                    if not df.empty:
-                        df.to_sql(table_name, engine, if_exists='replace', index=False)
-                        loaded_count += 1
-                except Exception as e:
-                    st.error(f"Error loading {table_name} into database: {e}")
+        # CSV-backed tables above this size stream into the database in
+        # bounded chunks instead of loading fully, so peak RSS stays
+        # constant however large the fact tables grow
+        stream_threshold = 50 * 1024 * 1024
+
+        def prefetch(name):
+            """Fetch a table for the database build.
+
+            Reuse a frame only if a page already materialized it in the
+            lazy csv_data store - peek() never triggers a load, so big
+            CSV-only tables still take the bounded-memory streaming
+            path instead of being parsed whole just for the build."""
+            store = globals().get('csv_data')
+            loaded = store.peek(name) if store is not None else None
+            if loaded is not None and not loaded.empty:
+                return loaded
+            parquet_file = processed_dir / f'{name}.parquet'
+            csv_file = processed_dir / f'{name}.csv'
+            if (not parquet_file.exists() and csv_file.exists()
+                    and csv_file.stat().st_size > stream_threshold):
+                return None
+            return read_processed_table(processed_dir, name)
+
+        # Parallelize the file reads only; the to_sql writes stay
+        # serial because SQLite takes a single write lock anyway
+        with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+            futures = {
+                name: executor.submit(prefetch, name)
+                for name in tables
+            }
+
+            with engine.connect() as conn:
+                # The database is rebuilt from scratch on every cold
+                # start, so durability doesn't matter - skip journaling
+                # and fsyncs and write everything in one transaction
+                conn.exec_driver_sql("PRAGMA journal_mode=OFF")
+                conn.exec_driver_sql("PRAGMA synchronous=OFF")
+                conn.exec_driver_sql("PRAGMA temp_store=MEMORY")
+                # Close the transaction SQLAlchemy 2.0 autobegins on
+                # the first execute, or the begin() below raises
+                conn.commit()
+                with conn.begin():
+                    for table_name, future in futures.items():
+                        try:
+                            df = future.result()
+                            if df is None:
+                                # Stream the oversized CSV in 100k-row
+                                # chunks inside the same transaction
+                                csv_file = processed_dir / f'{table_name}.csv'
+                                kwargs = _csv_read_kwargs(csv_file, table_name)
+                                replace = True
+                                for chunk in pd.read_csv(csv_file, chunksize=100_000, **kwargs):
+                                    chunk.to_sql(
+                                        table_name, conn,
+                                        if_exists='replace' if replace else 'append',
+                                        index=False, method='multi', chunksize=2000)
+                                    replace = False
+                                loaded_count += 1
+                            elif not df.empty:
+                                # chunksize * columns must stay under
+                                # SQLite's 32766 bind-variable cap
+                                df.to_sql(table_name, conn, if_exists='replace',
+                                          index=False, method='multi', chunksize=2000)
+                                loaded_count += 1
+                        except Exception as e:
+                            st.error(f"Error loading {table_name} into database: {e}")
         
         if loaded_count == 0:
             return None
-            
+
+        # Precompute the month key once: strftime in a GROUP BY runs
+        # per row on every aggregate build and an expression key can't
+        # use an index, so one UPDATE pays that cost a single time
+        with engine.connect() as conn:
+            with conn.begin():
+                try:
+                    conn.exec_driver_sql(
+                        "ALTER TABLE fact_orders ADD COLUMN order_month TEXT")
+                    conn.exec_driver_sql(
+                        "UPDATE fact_orders SET order_month = strftime('%Y-%m', order_date)")
+                except Exception:
+                    # fact_orders missing from a partial load
+                    pass
+
+        # to_sql creates bare tables, so every dashboard JOIN would be
+        # a nested scan. Index the join/filter columns and ANALYZE so
+        # the planner actually uses them.
+        index_statements = [
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_products_pid ON dim_products(product_id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_users_uid ON dim_users(user_id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_fact_orders_oid ON fact_orders(order_id)",
+            "CREATE INDEX IF NOT EXISTS idx_foi_product_id ON fact_order_items(product_id)",
+            "CREATE INDEX IF NOT EXISTS idx_foi_order_id ON fact_order_items(order_id)",
+            "CREATE INDEX IF NOT EXISTS idx_foi_user_id ON fact_order_items(user_id)",
+            "CREATE INDEX IF NOT EXISTS idx_fact_reviews_pid ON fact_reviews(product_id)",
+            "CREATE INDEX IF NOT EXISTS idx_fact_orders_date ON fact_orders(order_date)",
+            "CREATE INDEX IF NOT EXISTS idx_fact_orders_month ON fact_orders(order_month)",
+            # Covering index: the monthly revenue join reads only these
+            # three columns, so it never touches the base table
+            "CREATE INDEX IF NOT EXISTS idx_foi_order_product ON fact_order_items(order_id, product_id, item_total)",
+        ]
+        with engine.connect() as conn:
+            for stmt in index_statements:
+                try:
+                    conn.exec_driver_sql(stmt)
+                except Exception:
+                    # Table or column missing (partial load) - skip
+                    pass
+            conn.exec_driver_sql("ANALYZE")
+
+        # Materialize the dashboard aggregates once, so page loads read
+        # tiny summary tables instead of re-scanning the fact tables
+        agg_statements = {
+            'agg_kpis': """
+                CREATE TABLE agg_kpis AS
+                SELECT COUNT(DISTINCT order_id) AS total_orders,
+                       COUNT(DISTINCT user_id) AS total_customers,
+                       SUM(item_total) AS total_revenue
+                FROM fact_order_items
+            """,
+            'agg_monthly_revenue': """
+                CREATE TABLE agg_monthly_revenue AS
+                SELECT o.order_month AS month,
+                       ROUND(SUM(oi.item_total), 2) AS revenue
+                FROM fact_order_items oi
+                JOIN fact_orders o ON oi.order_id = o.order_id
+                GROUP BY o.order_month
+                ORDER BY o.order_month
+            """,
+            'agg_top_products': """
+                CREATE TABLE agg_top_products AS
+                SELECT p.product_name,
+                       ROUND(SUM(oi.item_total), 2) AS total_revenue,
+                       COUNT(*) AS quantity_sold
+                FROM fact_order_items oi
+                JOIN dim_products p ON oi.product_id = p.product_id
+                GROUP BY p.product_name
+                ORDER BY total_revenue DESC
+                LIMIT 10
+            """,
+            'agg_customer_metrics': """
+                CREATE TABLE agg_customer_metrics AS
+                SELECT COUNT(*) AS total_customers,
+                       ROUND(AVG(order_count), 2) AS avg_orders_per_customer,
+                       ROUND(AVG(total_spent), 2) AS avg_spend_per_customer
+                FROM (
+                    SELECT user_id,
+                           COUNT(DISTINCT order_id) AS order_count,
+                           SUM(item_total) AS total_spent
+                    FROM fact_order_items
+                    GROUP BY user_id
+                )
+            """,
+            'agg_product_reviews': """
+                CREATE TABLE agg_product_reviews AS
+                SELECT p.product_name,
+                       ROUND(AVG(r.rating), 2) AS avg_rating,
+                       COUNT(r.review_id) AS review_count
+                FROM fact_reviews r
+                JOIN dim_products p ON r.product_id = p.product_id
+                GROUP BY p.product_name
+                ORDER BY avg_rating DESC
+                LIMIT 10
+            """,
+            'dim_user_stats': """
+                CREATE TABLE dim_user_stats AS
+                SELECT user_id,
+                       COUNT(DISTINCT order_id) AS order_count,
+                       SUM(item_total) AS total_spent,
+                       CASE WHEN SUM(item_total) > 5000 THEN 'Premium (>$5k)'
+                            WHEN SUM(item_total) > 2000 THEN 'Gold ($2k-$5k)'
+                            WHEN SUM(item_total) > 500 THEN 'Silver ($500-$2k)'
+                            ELSE 'Bronze (<$500)' END AS segment
+                FROM fact_order_items
+                GROUP BY user_id
+            """,
+            'agg_category_stats': """
+                CREATE TABLE agg_category_stats AS
+                SELECT p.category,
+                       COUNT(DISTINCT oi.product_id) AS product_count,
+                       COUNT(DISTINCT oi.order_id) AS order_count,
+                       ROUND(SUM(oi.item_total), 2) AS category_revenue,
+                       ROUND(AVG(oi.item_price), 2) AS avg_price,
+                       SUM(oi.quantity) AS total_quantity
+                FROM fact_order_items oi
+                JOIN dim_products p ON oi.product_id = p.product_id
+                GROUP BY p.category
+                ORDER BY category_revenue DESC
+            """,
+            # Per-product review rollup, one row per product. Joining
+            # this instead of raw fact_reviews keeps the performance
+            # query at O(items + reviews) - a direct LEFT JOIN on the
+            # reviews fact would fan each item row out per review
+            'dim_product_rating': """
+                CREATE TABLE dim_product_rating AS
+                SELECT product_id,
+                       ROUND(AVG(CAST(rating AS FLOAT)), 2) AS avg_rating,
+                       COUNT(*) AS review_count
+                FROM fact_reviews
+                GROUP BY product_id
+            """,
+            'agg_product_performance': """
+                CREATE TABLE agg_product_performance AS
+                SELECT oi.product_id,
+                       p.product_name,
+                       p.category,
+                       COUNT(DISTINCT oi.order_id) AS times_sold,
+                       SUM(oi.quantity) AS units_sold,
+                       ROUND(SUM(oi.item_total), 2) AS total_revenue,
+                       ROUND(AVG(oi.item_price), 2) AS avg_price,
+                       COALESCE(r.avg_rating, 0) AS avg_rating
+                FROM fact_order_items oi
+                JOIN dim_products p ON oi.product_id = p.product_id
+                LEFT JOIN dim_product_rating r ON oi.product_id = r.product_id
+                GROUP BY oi.product_id, p.product_name, p.category, r.avg_rating
+                ORDER BY total_revenue DESC
+                LIMIT 15
+            """,
+        }
+        with engine.connect() as conn:
+            with conn.begin():
+                for agg_name, create_sql in agg_statements.items():
+                    try:
+                        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {agg_name}")
+                        conn.exec_driver_sql(create_sql)
+                    except Exception:
+                        # Source table missing - the pandas fallback
+                        # in the query function still works
+                        pass
+
+        # Mark the build complete so warm restarts skip the rebuild
+        sentinel.write_text(datetime.now().isoformat())
+
         return engine
         
     except Exception as e:
@@ -82,11 +469,216 @@ def get_database_engine():
         import traceback
         with st.expander("Error Details"):
             st.code(traceback.format_exc())
+        # If the base tables landed, keep the engine: a failure in the
+        # post-load tuning (month key, indexes, rollups) only costs
+        # speed, while returning None silently degrades every page to
+        # the pandas fallback
+        if engine is not None and loaded_count > 0:
+            return engine
+        return None
+
+# DuckDB summary views mirroring the SQLite agg_* tables. They stay
+# plain views rather than materialized tables: the vectorized Parquet
+# scans are fast enough to run per query. Note DuckDB's strftime takes
+# (value, format), the reverse of SQLite's argument order.
+_DUCKDB_AGG_VIEWS = {
+    'agg_kpis': """
+        CREATE VIEW agg_kpis AS
+        SELECT COUNT(DISTINCT order_id) AS total_orders,
+               COUNT(DISTINCT user_id) AS total_customers,
+               SUM(item_total) AS total_revenue
+        FROM fact_order_items
+    """,
+    'agg_monthly_revenue': """
+        CREATE VIEW agg_monthly_revenue AS
+        SELECT strftime(o.order_date, '%Y-%m') AS month,
+               ROUND(SUM(oi.item_total), 2) AS revenue
+        FROM fact_order_items oi
+        JOIN fact_orders o ON oi.order_id = o.order_id
+        GROUP BY month
+        ORDER BY month
+    """,
+    'agg_top_products': """
+        CREATE VIEW agg_top_products AS
+        SELECT p.product_name,
+               ROUND(SUM(oi.item_total), 2) AS total_revenue,
+               COUNT(*) AS quantity_sold
+        FROM fact_order_items oi
+        JOIN dim_products p ON oi.product_id = p.product_id
+        GROUP BY p.product_name
+        ORDER BY total_revenue DESC
+        LIMIT 10
+    """,
+    'agg_customer_metrics': """
+        CREATE VIEW agg_customer_metrics AS
+        SELECT COUNT(*) AS total_customers,
+               ROUND(AVG(order_count), 2) AS avg_orders_per_customer,
+               ROUND(AVG(total_spent), 2) AS avg_spend_per_customer
+        FROM (
+            SELECT user_id,
+                   COUNT(DISTINCT order_id) AS order_count,
+                   SUM(item_total) AS total_spent
+            FROM fact_order_items
+            GROUP BY user_id
+        )
+    """,
+    'agg_product_reviews': """
+        CREATE VIEW agg_product_reviews AS
+        SELECT p.product_name,
+               ROUND(AVG(r.rating), 2) AS avg_rating,
+               COUNT(r.review_id) AS review_count
+        FROM fact_reviews r
+        JOIN dim_products p ON r.product_id = p.product_id
+        GROUP BY p.product_name
+        ORDER BY avg_rating DESC
+        LIMIT 10
+    """,
+    'dim_user_stats': """
+        CREATE VIEW dim_user_stats AS
+        SELECT user_id,
+               COUNT(DISTINCT order_id) AS order_count,
+               SUM(item_total) AS total_spent,
+               CASE WHEN SUM(item_total) > 5000 THEN 'Premium (>$5k)'
+                    WHEN SUM(item_total) > 2000 THEN 'Gold ($2k-$5k)'
+                    WHEN SUM(item_total) > 500 THEN 'Silver ($500-$2k)'
+                    ELSE 'Bronze (<$500)' END AS segment
+        FROM fact_order_items
+        GROUP BY user_id
+    """,
+    'agg_category_stats': """
+        CREATE VIEW agg_category_stats AS
+        SELECT p.category,
+               COUNT(DISTINCT oi.product_id) AS product_count,
+               COUNT(DISTINCT oi.order_id) AS order_count,
+               ROUND(SUM(oi.item_total), 2) AS category_revenue,
+               ROUND(AVG(oi.item_price), 2) AS avg_price,
+               SUM(oi.quantity) AS total_quantity
+        FROM fact_order_items oi
+        JOIN dim_products p ON oi.product_id = p.product_id
+        GROUP BY p.category
+        ORDER BY category_revenue DESC
+    """,
+    'dim_product_rating': """
+        CREATE VIEW dim_product_rating AS
+        SELECT product_id,
+               ROUND(AVG(CAST(rating AS FLOAT)), 2) AS avg_rating,
+               COUNT(*) AS review_count
+        FROM fact_reviews
+        GROUP BY product_id
+    """,
+    'agg_product_performance': """
+        CREATE VIEW agg_product_performance AS
+        SELECT oi.product_id,
+               p.product_name,
+               p.category,
+               COUNT(DISTINCT oi.order_id) AS times_sold,
+               SUM(oi.quantity) AS units_sold,
+               ROUND(SUM(oi.item_total), 2) AS total_revenue,
+               ROUND(AVG(oi.item_price), 2) AS avg_price,
+               COALESCE(r.avg_rating, 0) AS avg_rating
+        FROM fact_order_items oi
+        JOIN dim_products p ON oi.product_id = p.product_id
+        LEFT JOIN dim_product_rating r ON oi.product_id = r.product_id
+        GROUP BY oi.product_id, p.product_name, p.category, r.avg_rating
+        ORDER BY total_revenue DESC
+        LIMIT 15
+    """,
+}
+
+@st.cache_resource
+def get_duckdb_connection():
+    """Columnar read engine over the processed Parquet files, or None.
+
+    Registers each Parquet file as a view plus the agg_* summary views,
+    so the existing read queries run unchanged while DuckDB pushes
+    projections and predicates straight into the Parquet reader."""
+    if duckdb is None:
+        return None
+    processed_dir = Path(__file__).parent / 'Data' / 'Processed'
+    tables = [
+        'dim_products', 'dim_users', 'fact_orders',
+        'fact_order_items', 'fact_reviews', 'fact_events'
+    ]
+    parquet = {t: processed_dir / f'{t}.parquet' for t in tables}
+    # Without the core star-schema files the SQLite path serves instead
+    if not parquet['fact_order_items'].exists():
+        return None
+    try:
+        con = duckdb.connect()
+        for table_name, path in parquet.items():
+            if path.exists():
+                con.execute(
+                    f"CREATE VIEW {table_name} AS SELECT * FROM read_parquet('{path.as_posix()}')"
+                )
+        for view_sql in _DUCKDB_AGG_VIEWS.values():
+            try:
+                con.execute(view_sql)
+            except Exception:
+                # Source view missing - SQLite or pandas covers it
+                pass
+        return con
+    except Exception:
+        return None
+
+# Dashboard read queries, built once at import time
+AGG_TABLES = (
+    'agg_kpis', 'agg_monthly_revenue', 'agg_top_products',
+    'agg_customer_metrics', 'agg_product_reviews', 'agg_category_stats',
+    'agg_product_performance'
+)
+_AGG_QUERIES = {t: f'SELECT * FROM {t}' for t in AGG_TABLES}
+
+@st.cache_resource
+def get_read_connection():
+    """Persistent sqlite3 connection for dashboard reads.
+
+    pd.read_sql_query over a raw sqlite3 connection skips SQLAlchemy's
+    per-call SQL parsing and connection checkout. check_same_thread is
+    off because Streamlit reruns arrive on different threads; the
+    connection is pinned read-only via query_only so sharing it is
+    safe. A 64 MB page cache plus a 256 MB mmap window keep the
+    summary tables hot without copying pages through SQLite's cache."""
+    if get_database_engine() is None:
+        return None
+    import sqlite3
+    db_path = Path(__file__).parent / 'ecommerce.db'
+    try:
+        conn = sqlite3.connect(str(db_path.absolute()), check_same_thread=False)
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+    except Exception:
         return None
 
 # Initialize on startup
-csv_data = load_csv_data()
+csv_data = _TableStore()
+duck_conn = get_duckdb_connection()
 engine = get_database_engine()
+read_conn = get_read_connection()
+
+def query_df(query):
+    """Run one read query on the fastest available engine.
+
+    DuckDB (columnar, scans Parquet directly) when installed, then the
+    persistent SQLite connection; returns None when neither serves."""
+    if duck_conn is not None:
+        try:
+            # Per-call cursor: the shared connection holds one result
+            # at a time, and parallel() runs page queries concurrently
+            df = duck_conn.cursor().execute(query).df()
+            if not df.empty:
+                return df
+        except Exception:
+            pass
+    if read_conn is not None:
+        try:
+            df = pd.read_sql_query(query, read_conn, **_SQL_READ_KWARGS)
+            if not df.empty:
+                return df
+        except Exception:
+            pass
+    return None
 
 # Check if we have data
 if csv_data.get('fact_order_items', pd.DataFrame()).empty:
@@ -94,113 +686,39 @@ if csv_data.get('fact_order_items', pd.DataFrame()).empty:
     st.info("Required files: fact_order_items.csv, fact_orders.csv, dim_users.csv, dim_products.csv")
     st.stop()
 
-# Custom CSS for beautiful styling
-st.markdown("""
-    <style>
-    /* Main theme colors */
-    :root {
-        --primary-color: #667eea;
-        --secondary-color: #764ba2;
-        --accent-color: #f39c12;
-    }
-    
-    /* Page background */
-    .main {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-    }
-    
-    /* Title styling */
-    h1 {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        font-size: 3em;
-        margin-bottom: 10px;
-        text-shadow: none;
-    }
-    
-    /* Subtitle */
-    .subtitle {
-        text-align: center;
-        color: #555;
-        font-size: 1.2em;
-        margin-bottom: 30px;
-    }
-    
-    /* Section headers */
-    h2 {
-        color: #2c3e50;
-        border-bottom: 3px solid #667eea;
-        padding-bottom: 10px;
-        margin-top: 40px;
-        font-size: 1.8em;
-    }
-    
-    /* Metric cards with gradient */
-    [data-testid="metric-container"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px !important;
-        border-radius: 15px !important;
-        box-shadow: 0 8px 16px rgba(102, 126, 234, 0.3) !important;
-        border-left: 5px solid #f39c12;
-    }
-    
-    [data-testid="metric-container"] > div {
-        color: white !important;
-    }
-    
-    /* Chart container */
-    .plotly-graph-div {
-        border-radius: 12px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        padding: 10px;
-    }
-    
-    /* Column separator */
-    .column-divider {
-        border-right: 2px solid #e0e0e0;
-    }
-    
-    /* Success messages */
-    .stAlert {
-        border-radius: 10px;
-        padding: 15px;
-    }
-    
-    /* Data table */
-    .stDataFrame {
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Divider line */
-    hr {
-        border: none;
-        height: 2px;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        margin: 40px 0;
-    }
-    
-    /* Footer */
-    footer {
-        background-color: transparent;
-    }
-    
-    /* Text styling */
-    .info-text {
-        color: #555;
-        font-size: 0.95em;
-        line-height: 1.6;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Custom CSS for beautiful styling, read from disk once per process so
+# every rerun reuses the same cached string instead of re-allocating
+# the multi-kilobyte literal
+@st.cache_resource
+def _css():
+    return (Path(__file__).parent / 'style.css').read_text()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
 
 # Sidebar Navigation
 st.sidebar.title("Dashboard Navigation")
 page = st.sidebar.selectbox("Choose a page", ["Overview", "Analytics"])
 
+# Manual escape hatch for the mtime-keyed caches
+if st.sidebar.button("🔄 Refresh data"):
+    st.cache_data.clear()
+
+# Dev-only: per-cache entry sizes, for spotting queries that miss the
+# cache or hold more data than expected (see README for py-spy workflow)
+if st.sidebar.checkbox("Show perf stats"):
+    try:
+        # get_stats() isn't documented public API, so don't let a
+        # Streamlit upgrade take the sidebar down with it
+        st.sidebar.json([
+            {'cache': s.cache_name, 'category': s.category_name,
+             'bytes': s.byte_length}
+            for s in st.cache_data.get_stats()
+        ])
+    except Exception:
+        st.sidebar.caption(
+            "Cache stats unavailable in this Streamlit version")
+
 analytics_option = None
 if page == "Analytics":
     analytics_option = st.sidebar.selectbox(
@@ -221,14 +739,10 @@ if page == "Analytics":
 # Data loading functions - use CSV directly if database fails
 def load_data(query):
     """Load data - try database first, fallback to CSV"""
-    if engine:
-        try:
-            result = pd.read_sql(query, engine)
-            if not result.empty:
-                return result
-        except:
-            pass  # Fall back to CSV
-    
+    result = query_df(query)
+    if result is not None:
+        return result
+
     # Fallback: Calculate from CSV data
     return calculate_from_csv(query)
 
@@ -237,24 +751,66 @@ def calculate_from_csv(query):
     # This is a simplified fallback - implement specific queries as needed
     return pd.DataFrame()
 
+def load_agg(table_name):
+    """Return a precomputed agg_* summary table, or None when the
+    database (or that aggregate) is unavailable."""
+    return query_df(_AGG_QUERIES.get(table_name, f'SELECT * FROM {table_name}'))
+
 # Query Functions using CSV data directly
-def get_kpis():
-    """Get key performance indicators"""
+@st.cache_data(ttl=3600)
+def get_customer_stats():
+    """Per-customer order counts and spend, computed once.
+
+    The KPI, customer-metrics, segmentation and top-customers fallbacks
+    all need the same per-user aggregate; one cached groupby replaces
+    four separate scans of fact_order_items."""
     if 'fact_order_items' not in csv_data or csv_data['fact_order_items'].empty:
+        return pd.DataFrame()
+
+    df = csv_data['fact_order_items']
+    stats = df.groupby('user_id', sort=False).agg({
+        'item_total': 'sum',
+        'item_price': 'mean'
+    }).reset_index()
+    stats.columns = ['user_id', 'total_spent', 'avg_purchase']
+    # Distinct orders per user without nunique's per-group hash sets:
+    # every order has one owner, so one global dedup plus a size count
+    # gives the same answer in two C passes
+    order_counts = df.drop_duplicates('order_id').groupby('user_id', sort=False).size()
+    stats.insert(1, 'order_count',
+                 stats['user_id'].map(order_counts).fillna(0).astype('int64'))
+    return stats
+
+def get_kpis(agg=None):
+    """Get key performance indicators"""
+    if agg is None:
+        agg = load_agg('agg_kpis')
+    if agg is not None:
+        total_orders = int(agg['total_orders'].iloc[0] or 0)
+        total_revenue = float(agg['total_revenue'].iloc[0] or 0.0)
+        return {
+            'total_orders': total_orders,
+            'total_customers': int(agg['total_customers'].iloc[0] or 0),
+            'total_revenue': round(total_revenue, 2),
+            'avg_order_value': round(total_revenue / total_orders, 2) if total_orders > 0 else 0.0
+        }
+
+    stats = get_customer_stats()
+    if stats.empty:
         return {
             'total_orders': 0,
             'total_customers': 0,
             'total_revenue': 0.0,
             'avg_order_value': 0.0
         }
-    
-    df = csv_data['fact_order_items']
-    
-    total_orders = df['order_id'].nunique()
-    total_customers = df['user_id'].nunique()
-    total_revenue = df['item_total'].sum()
+
+    # Each order belongs to one customer, so per-user distinct orders
+    # sum to the global distinct count
+    total_orders = stats['order_count'].sum()
+    total_customers = len(stats)
+    total_revenue = stats['total_spent'].sum()
     avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
-    
+
     return {
         'total_orders': int(total_orders),
         'total_customers': int(total_customers),
@@ -262,36 +818,62 @@ def get_kpis():
         'avg_order_value': float(round(avg_order_value, 2))
     }
 
-def get_revenue_by_month():
+@st.cache_data(ttl=3600)
+def get_enriched_items():
+    """One wide order-items table shared by the pandas fallbacks.
+
+    The fallback queries all want the same product and order
+    attributes; merging them onto the items once here replaces a hash
+    join inside every query with a single cached build, month key
+    included."""
+    if 'fact_order_items' not in csv_data or csv_data['fact_order_items'].empty:
+        return pd.DataFrame()
+
+    enriched = csv_data['fact_order_items']
+    products = csv_data.get('dim_products', pd.DataFrame())
+    if not products.empty:
+        enriched = enriched.merge(
+            products[['product_id', 'product_name', 'category']],
+            on='product_id', how='left')
+    orders = csv_data.get('fact_orders', pd.DataFrame())
+    if not orders.empty:
+        enriched = enriched.merge(
+            orders[['order_id', 'order_date']], on='order_id', how='left')
+        enriched['order_date'] = pd.to_datetime(enriched['order_date'])
+        # strftime is one vectorized pass; to_period + astype(str)
+        # would build a PeriodArray and format each element in Python
+        enriched['month'] = enriched['order_date'].dt.strftime('%Y-%m')
+    return enriched
+
+def get_revenue_by_month(agg=None):
     """Get monthly revenue trend"""
-    if 'fact_order_items' not in csv_data or 'fact_orders' not in csv_data:
+    if agg is None:
+        agg = load_agg('agg_monthly_revenue')
+    if agg is not None:
+        return agg
+
+    enriched = get_enriched_items()
+    if enriched.empty or 'month' not in enriched:
         return pd.DataFrame()
-    
-    order_items = csv_data['fact_order_items']
-    orders = csv_data['fact_orders']
-    
-    # Merge and calculate
-    merged = order_items.merge(orders[['order_id', 'order_date']], on='order_id', how='left')
-    merged['order_date'] = pd.to_datetime(merged['order_date'])
-    merged['month'] = merged['order_date'].dt.to_period('M').astype(str)
-    
-    monthly = merged.groupby('month')['item_total'].sum().reset_index()
+
+    monthly = enriched.groupby('month', sort=False)['item_total'].sum().reset_index()
     monthly.columns = ['month', 'revenue']
     monthly['revenue'] = monthly['revenue'].round(2)
     
     return monthly.sort_values('month')
 
-def get_top_products():
+def get_top_products(agg=None):
     """Get top 10 products by revenue"""
-    if 'fact_order_items' not in csv_data or 'dim_products' not in csv_data:
+    if agg is None:
+        agg = load_agg('agg_top_products')
+    if agg is not None:
+        return agg
+
+    enriched = get_enriched_items()
+    if enriched.empty or 'product_name' not in enriched:
         return pd.DataFrame()
-    
-    order_items = csv_data['fact_order_items']
-    products = csv_data['dim_products']
-    
-    merged = order_items.merge(products[['product_id', 'product_name']], on='product_id', how='left')
-    
-    top = merged.groupby('product_name').agg({
+
+    top = enriched.groupby('product_name', sort=False).agg({
         'item_total': 'sum',
         'quantity': 'count'
     }).reset_index()
@@ -301,24 +883,25 @@ def get_top_products():
     
     return top.nlargest(10, 'total_revenue')
 
-def get_customer_metrics():
+def get_customer_metrics(agg=None):
     """Get customer-related metrics"""
-    if 'fact_order_items' not in csv_data:
+    if agg is None:
+        agg = load_agg('agg_customer_metrics')
+    if agg is not None:
+        return {
+            'total_customers': int(agg['total_customers'].iloc[0] or 0),
+            'avg_orders_per_customer': float(agg['avg_orders_per_customer'].iloc[0] or 0.0),
+            'avg_spend_per_customer': float(agg['avg_spend_per_customer'].iloc[0] or 0.0)
+        }
+
+    customer_stats = get_customer_stats()
+    if customer_stats.empty:
         return {
             'total_customers': 0,
             'avg_orders_per_customer': 0.0,
             'avg_spend_per_customer': 0.0
         }
-    
-    df = csv_data['fact_order_items']
-    
-    customer_stats = df.groupby('user_id').agg({
-        'order_id': 'nunique',
-        'item_total': 'sum'
-    }).reset_index()
-    
-    customer_stats.columns = ['user_id', 'order_count', 'total_spent']
-    
+
     total_customers = len(customer_stats)
     avg_orders = customer_stats['order_count'].mean()
     avg_spend = customer_stats['total_spent'].mean()
@@ -329,77 +912,108 @@ def get_customer_metrics():
         'avg_spend_per_customer': float(round(avg_spend, 2))
     }
 
-def get_product_reviews():
+@st.cache_data(ttl=3600)
+def _ratings_by_product():
+    """Per-product review mean and count, computed once.
+
+    Shared by the review and product-performance fallbacks so
+    fact_reviews is scanned a single time."""
+    if 'fact_reviews' not in csv_data or csv_data['fact_reviews'].empty:
+        return pd.DataFrame()
+
+    ratings = csv_data['fact_reviews'].groupby('product_id', sort=False).agg(
+        avg_rating=('rating', 'mean'),
+        review_count=('rating', 'count'),
+    ).reset_index()
+    ratings['avg_rating'] = ratings['avg_rating'].round(2)
+    return ratings
+
+def get_product_reviews(agg=None):
     """Get product ratings"""
-    if 'fact_reviews' not in csv_data or 'dim_products' not in csv_data:
+    if agg is None:
+        agg = load_agg('agg_product_reviews')
+    if agg is not None:
+        return agg
+
+    ratings = _ratings_by_product()
+    if ratings.empty or 'dim_products' not in csv_data:
         return pd.DataFrame()
-    
-    reviews = csv_data['fact_reviews']
+
     products = csv_data['dim_products']
-    
-    merged = reviews.merge(products[['product_id', 'product_name']], on='product_id', how='left')
-    
-    product_reviews = merged.groupby('product_name').agg({
-        'rating': 'mean',
-        'review_id': 'count'
-    }).reset_index()
-    
-    product_reviews.columns = ['product_name', 'avg_rating', 'review_count']
-    product_reviews['avg_rating'] = product_reviews['avg_rating'].round(2)
-    
+    product_reviews = ratings.merge(
+        products[['product_id', 'product_name']], on='product_id', how='left')
+    product_reviews = product_reviews[['product_name', 'avg_rating', 'review_count']]
+
     return product_reviews.nlargest(10, 'avg_rating')
 
-def get_category_analysis():
+@st.cache_data(ttl=3600)
+def get_category_analysis(agg=None, db_mtime=None):
     """Get product category analysis"""
-    if 'fact_order_items' not in csv_data or 'dim_products' not in csv_data:
+    if agg is None:
+        agg = load_agg('agg_category_stats')
+    if agg is not None:
+        return agg
+
+    enriched = get_enriched_items()
+    if enriched.empty or 'category' not in enriched:
         return pd.DataFrame()
-    
-    order_items = csv_data['fact_order_items']
-    products = csv_data['dim_products']
-    
-    merged = order_items.merge(products[['product_id', 'category']], on='product_id', how='left')
-    
-    category_stats = merged.groupby('category').agg({
-        'product_id': 'nunique',
-        'order_id': 'nunique',
+
+    category_stats = enriched.groupby('category', observed=True, sort=False).agg({
         'item_total': 'sum',
         'item_price': 'mean',
         'quantity': 'sum'
     }).reset_index()
-    
-    category_stats.columns = ['category', 'product_count', 'order_count', 'category_revenue', 'avg_price', 'total_quantity']
+    category_stats.columns = ['category', 'category_revenue', 'avg_price', 'total_quantity']
+
+    # Distinct products/orders per category via one dedup of the key
+    # pair instead of a hash set per group
+    for position, (name, key) in enumerate(
+            [('product_count', 'product_id'), ('order_count', 'order_id')],
+            start=1):
+        counts = enriched.drop_duplicates(['category', key]).groupby('category', observed=True, sort=False).size()
+        category_stats.insert(
+            position, name,
+            category_stats['category'].map(counts).fillna(0).astype('int64'))
     category_stats['category_revenue'] = category_stats['category_revenue'].round(2)
     category_stats['avg_price'] = category_stats['avg_price'].round(2)
     
     return category_stats.sort_values('category_revenue', ascending=False)
 
-def get_customer_segments():
+@st.cache_data(ttl=3600)
+def get_customer_segments(db_mtime=None):
     """Get customer segmentation analysis"""
-    if 'fact_order_items' not in csv_data:
+    # The per-customer tier is precomputed into dim_user_stats at
+    # database build time, so this is a tiny GROUP BY over one row per
+    # customer instead of a fact scan plus per-row CASE per page view
+    agg = query_df("""
+        SELECT segment,
+               COUNT(*) AS customer_count,
+               ROUND(AVG(total_spent), 2) AS avg_spend,
+               ROUND(SUM(total_spent), 2) AS segment_revenue,
+               ROUND(AVG(order_count), 2) AS avg_orders
+        FROM dim_user_stats
+        GROUP BY segment
+        ORDER BY segment_revenue DESC
+    """)
+    if agg is not None:
+        return agg
+
+    customer_stats = get_customer_stats()
+    if customer_stats.empty:
         return pd.DataFrame()
+
+    customer_stats = customer_stats[['user_id', 'order_count', 'total_spent']].copy()
+
+    # Vectorized bucketing: pd.cut bins every customer in one C pass
+    # instead of a Python-level apply per row
+    customer_stats['segment'] = pd.cut(
+        customer_stats['total_spent'],
+        bins=[-np.inf, 500, 2000, 5000, np.inf],
+        labels=['Bronze (<$500)', 'Silver ($500-$2k)',
+                'Gold ($2k-$5k)', 'Premium (>$5k)'],
+    )
     
-    df = csv_data['fact_order_items']
-    
-    customer_stats = df.groupby('user_id').agg({
-        'order_id': 'nunique',
-        'item_total': 'sum'
-    }).reset_index()
-    
-    customer_stats.columns = ['user_id', 'order_count', 'total_spent']
-    
-    def get_segment(spent):
-        if spent > 5000:
-            return 'Premium (>$5k)'
-        elif spent > 2000:
-            return 'Gold ($2k-$5k)'
-        elif spent > 500:
-            return 'Silver ($500-$2k)'
-        else:
-            return 'Bronze (<$500)'
-    
-    customer_stats['segment'] = customer_stats['total_spent'].apply(get_segment)
-    
-    segments = customer_stats.groupby('segment').agg({
+    segments = customer_stats.groupby('segment', observed=True, sort=False).agg({
         'user_id': 'count',
         'total_spent': ['mean', 'sum'],
         'order_count': 'mean'
@@ -412,131 +1026,691 @@ def get_customer_segments():
     
     return segments.sort_values('segment_revenue', ascending=False)
 
-def get_sales_by_category():
+@st.cache_data(ttl=3600)
+def get_sales_by_category(db_mtime=None):
     """Get sales trend by category"""
-    if 'fact_order_items' not in csv_data or 'fact_orders' not in csv_data or 'dim_products' not in csv_data:
+    enriched = get_enriched_items()
+    if enriched.empty or 'month' not in enriched or 'category' not in enriched:
         return pd.DataFrame()
-    
-    order_items = csv_data['fact_order_items']
-    orders = csv_data['fact_orders']
-    products = csv_data['dim_products']
-    
-    merged = order_items.merge(orders[['order_id', 'order_date']], on='order_id', how='left')
-    merged = merged.merge(products[['product_id', 'category']], on='product_id', how='left')
-    
-    merged['order_date'] = pd.to_datetime(merged['order_date'])
-    merged['month'] = merged['order_date'].dt.to_period('M').astype(str)
-    
-    monthly_category = merged.groupby(['month', 'category'])['item_total'].sum().reset_index()
+
+    monthly_category = enriched.groupby(['month', 'category'], observed=True, sort=False)['item_total'].sum().reset_index()
     monthly_category.columns = ['month', 'category', 'revenue']
     monthly_category['revenue'] = monthly_category['revenue'].round(2)
     
     return monthly_category.sort_values(['month', 'revenue'], ascending=[True, False])
 
-def get_top_customers():
+@st.cache_data(ttl=3600)
+def get_top_customers(db_mtime=None):
     """Get top customers by revenue"""
-    if 'fact_order_items' not in csv_data or 'dim_users' not in csv_data:
+    customer_stats = get_customer_stats()
+    if customer_stats.empty or 'dim_users' not in csv_data:
         return pd.DataFrame()
-    
-    order_items = csv_data['fact_order_items']
+
     users = csv_data['dim_users']
-    
-    customer_stats = order_items.groupby('user_id').agg({
-        'order_id': 'nunique',
-        'item_total': 'sum',
-        'item_price': 'mean'
-    }).reset_index()
-    
-    customer_stats.columns = ['user_id', 'order_count', 'total_spent', 'avg_purchase']
-    
     merged = customer_stats.merge(users[['user_id', 'name']], on='user_id', how='left')
     merged['total_spent'] = merged['total_spent'].round(2)
     merged['avg_purchase'] = merged['avg_purchase'].round(2)
 
     return merged.nlargest(10, 'total_spent')[['user_id', 'name', 'order_count', 'total_spent', 'avg_purchase']]
 
-def get_product_performance():
+@st.cache_data(ttl=3600)
+def get_product_performance(db_mtime=None):
     """Get detailed product performance metrics"""
-    if 'fact_order_items' not in csv_data or 'dim_products' not in csv_data:
+    agg = load_agg('agg_product_performance')
+    if agg is not None:
+        return agg
+
+    enriched = get_enriched_items()
+    if enriched.empty or 'product_name' not in enriched:
         return pd.DataFrame()
-    
-    order_items = csv_data['fact_order_items']
-    products = csv_data['dim_products']
-    
-    merged = order_items.merge(products[['product_id', 'product_name', 'category']], on='product_id', how='left')
-    
-    product_stats = merged.groupby(['product_id', 'product_name', 'category']).agg({
-        'order_id': 'nunique',
+
+    product_stats = enriched.groupby(['product_id', 'product_name', 'category'], observed=True, sort=False).agg({
         'quantity': 'sum',
         'item_total': 'sum',
         'item_price': 'mean'
     }).reset_index()
-    
-    product_stats.columns = ['product_id', 'product_name', 'category', 'times_sold', 'units_sold', 'total_revenue', 'avg_price']
+    product_stats.columns = ['product_id', 'product_name', 'category', 'units_sold', 'total_revenue', 'avg_price']
+
+    # Distinct orders per product via one dedup of the pair, not a
+    # hash set per group
+    times_sold = enriched.drop_duplicates(['product_id', 'order_id']).groupby('product_id', sort=False).size()
+    product_stats.insert(
+        3, 'times_sold',
+        product_stats['product_id'].map(times_sold).fillna(0).astype('int64'))
     product_stats['total_revenue'] = product_stats['total_revenue'].round(2)
     product_stats['avg_price'] = product_stats['avg_price'].round(2)
     product_stats['units_sold'] = product_stats['units_sold'].round(0)
     
     # Add ratings if available
-    if 'fact_reviews' in csv_data and not csv_data['fact_reviews'].empty:
-        reviews = csv_data['fact_reviews']
-        avg_ratings = reviews.groupby('product_id')['rating'].mean().reset_index()
-        avg_ratings.columns = ['product_id', 'avg_rating']
-        avg_ratings['avg_rating'] = avg_ratings['avg_rating'].round(2)
-        product_stats = product_stats.merge(avg_ratings, on='product_id', how='left')
+    ratings = _ratings_by_product()
+    if not ratings.empty:
+        product_stats = product_stats.merge(
+            ratings[['product_id', 'avg_rating']], on='product_id', how='left')
         product_stats['avg_rating'] = product_stats['avg_rating'].fillna(0)
     else:
         product_stats['avg_rating'] = 0.0
     
     return product_stats.nlargest(15, 'total_revenue')
 
-def get_gender_distribution():
+@st.cache_data(ttl=3600)
+def get_gender_distribution(db_mtime=None):
     """Get gender distribution of users"""
+    # The database returns one row per gender instead of shipping the
+    # whole dim_users table across the boundary
+    agg = query_df("""
+        SELECT gender,
+               COUNT(*) AS count,
+               ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM dim_users), 1)
+                   AS percentage
+        FROM dim_users
+        GROUP BY gender
+    """)
+    if agg is not None:
+        return agg
+
     if 'dim_users' not in csv_data:
         return pd.DataFrame()
 
     users = csv_data['dim_users']
-    gender_dist = users['gender'].value_counts().reset_index()
-    gender_dist.columns = ['gender', 'count']
+    gender_dist = (users.groupby('gender', observed=True, sort=False)
+                   .size().rename('count').reset_index())
     gender_dist['percentage'] = (gender_dist['count'] / gender_dist['count'].sum() * 100).round(1)
 
     return gender_dist
 
-def get_city_distribution():
+@st.cache_data(ttl=3600)
+def get_city_distribution(db_mtime=None):
     """Get top cities by user count"""
+    # Percentage is of all users, so it's computed before the LIMIT
+    agg = query_df("""
+        SELECT city,
+               COUNT(*) AS user_count,
+               ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM dim_users), 1)
+                   AS percentage
+        FROM dim_users
+        GROUP BY city
+        ORDER BY user_count DESC
+        LIMIT 10
+    """)
+    if agg is not None:
+        return agg
+
     if 'dim_users' not in csv_data:
         return pd.DataFrame()
 
     users = csv_data['dim_users']
-    city_dist = users['city'].value_counts().reset_index()
-    city_dist.columns = ['city', 'user_count']
+    city_dist = (users.groupby('city', observed=True, sort=False)
+                 .size().rename('user_count').reset_index())
     city_dist['percentage'] = (city_dist['user_count'] / city_dist['user_count'].sum() * 100).round(1)
 
     return city_dist.nlargest(10, 'user_count')
 
-def get_signup_trends():
+@st.cache_data(ttl=3600)
+def get_signup_trends(db_mtime=None):
     """Get user signup trends by month"""
+    # SUBSTR of the ISO date works in both SQLite and DuckDB, unlike
+    # strftime whose argument order differs between the two
+    agg = query_df("""
+        SELECT SUBSTR(CAST(signup_date AS VARCHAR), 1, 7) AS month,
+               COUNT(*) AS new_users
+        FROM dim_users
+        GROUP BY month
+        ORDER BY month
+    """)
+    if agg is not None:
+        return agg
+
     if 'dim_users' not in csv_data:
         return pd.DataFrame()
 
     users = csv_data['dim_users']
     users['signup_date'] = pd.to_datetime(users['signup_date'])
-    users['signup_month'] = users['signup_date'].dt.to_period('M').astype(str)
+    users['signup_month'] = users['signup_date'].dt.strftime('%Y-%m')
 
-    signup_trends = users.groupby('signup_month').size().reset_index()
+    signup_trends = users.groupby('signup_month', sort=False).size().reset_index()
     signup_trends.columns = ['month', 'new_users']
 
     return signup_trends.sort_values('month')
 
+def _db_mtime():
+    """Cache key for the summary bundle and the per-page query
+    caches: the aggregates only change
+    when the database file is rebuilt, so its mtime is the natural
+    invalidation signal - no hourly recompute for data that hasn't
+    moved."""
+    db_path = Path(__file__).parent / 'ecommerce.db'
+    try:
+        return db_path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+def get_all_dashboard_data():
+    """Fetch every dashboard summary, cached until the database changes."""
+    return _dashboard_data(_db_mtime())
+
+@st.cache_data(ttl=None)
+def _dashboard_data(db_mtime):
+    """Fetch every dashboard summary as one cached bundle.
+
+    Reads the five agg_* summaries back-to-back on the fastest
+    available engine - one cache entry per hour, no per-query
+    connection checkout - and lets each summary function fall back to
+    its pandas path for anything the database can't serve."""
+    prefetched = {}
+    for key, table in [
+        ('kpis', 'agg_kpis'),
+        ('monthly_revenue', 'agg_monthly_revenue'),
+        ('top_products', 'agg_top_products'),
+        ('customer_metrics', 'agg_customer_metrics'),
+        ('product_reviews', 'agg_product_reviews'),
+    ]:
+        df = query_df(_AGG_QUERIES[table])
+        if df is not None:
+            prefetched[key] = df
+
+    return {
+        'kpis': get_kpis(prefetched.get('kpis')),
+        'monthly_revenue': get_revenue_by_month(prefetched.get('monthly_revenue')),
+        'top_products': get_top_products(prefetched.get('top_products')),
+        'customer_metrics': get_customer_metrics(prefetched.get('customer_metrics')),
+        'product_reviews': get_product_reviews(prefetched.get('product_reviews')),
+    }
+
+
+def parallel(*fns):
+    """Run independent data functions concurrently and return their
+    results in call order. The pandas groupby/value_counts kernels and
+    SQLite queries underneath release the GIL, so side-by-side charts
+    stop serializing their fetches."""
+    with ThreadPoolExecutor(max_workers=len(fns)) as executor:
+        futures = [executor.submit(fn) for fn in fns]
+        return [future.result() for future in futures]
+
+
+def lttb_downsample(df, y_col, n_out=1000):
+    """Largest-Triangle-Three-Buckets downsampling for line charts.
+
+    The browser can only resolve a couple of thousand points per
+    series, but Plotly serializes and renders every row it is given.
+    LTTB keeps the points that preserve the visual shape (peaks and
+    inflections) instead of a blind stride; frames at or under n_out
+    rows pass through untouched, so monthly data is unaffected and
+    daily-granularity histories get capped."""
+    n = len(df)
+    if n <= n_out:
+        return df
+    x = np.arange(n, dtype=np.float64)
+    y = pd.to_numeric(df[y_col], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+    keep = [0]
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle vertex
+        lo_next = int((i + 1) * every) + 1
+        hi_next = min(int((i + 2) * every) + 1, n)
+        avg_x = x[lo_next:hi_next].mean()
+        avg_y = y[lo_next:hi_next].mean()
+        # Pick the point in the current bucket with the largest triangle
+        lo = int(i * every) + 1
+        hi = min(int((i + 1) * every) + 1, n)
+        areas = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(areas))
+        keep.append(a)
+    keep.append(n - 1)
+    return df.iloc[keep]
+
+
 # Main App
 st.title("E-Commerce Analytics Dashboard")
 st.markdown('<p class="subtitle">Real-time insights into your e-commerce business performance</p>', unsafe_allow_html=True)
 
+# Each analytics page is a fragment: when the user flips a widget
+# inside one, Streamlit reruns just that function instead of the
+# whole script, so the other pages pay nothing for the interaction.
+@st.fragment
+def page_revenue_trends():
+    # Revenue Trend Section
+    st.markdown("### 📊 Revenue Trend", unsafe_allow_html=True)
+    revenue_data = get_all_dashboard_data()['monthly_revenue']
+    if not revenue_data.empty:
+        revenue_data = lttb_downsample(revenue_data, 'revenue')
+        fig_revenue = px.line(
+            revenue_data,
+            x='month',
+            y='revenue',
+            title='Monthly Revenue Trend',
+            markers=True,
+            line_shape='linear',
+            template='plotly_white'
+        )
+        fig_revenue.update_traces(
+            line=dict(color='#667eea', width=3),
+            marker=dict(size=10, color='#764ba2')
+        )
+        fig_revenue.update_layout(
+            hovermode='x unified',
+            plot_bgcolor='rgba(240, 240, 240, 0.5)',
+            paper_bgcolor='rgba(255,255,255,0)',
+            font=dict(size=12),
+            height=400
+        )
+        st.plotly_chart(fig_revenue, use_container_width=True)
+    else:
+        st.info("No revenue data available")
+
+
+@st.fragment
+def page_products_performance():
+    # Products and Ratings Section
+    st.markdown("### 🏆 Products Performance", unsafe_allow_html=True)
+    col1, col2 = st.columns(2, gap="large")
+
+    with col1:
+        st.markdown("#### Top 10 Products by Revenue")
+        top_products = get_all_dashboard_data()['top_products']
+        if not top_products.empty:
+            fig_products = px.bar(
+                top_products,
+                x='total_revenue',
+                y='product_name',
+                orientation='h',
+                template='plotly_white',
+                color='total_revenue',
+                color_continuous_scale='Viridis'
+            )
+            fig_products.update_layout(
+                showlegend=False,
+                hovermode='y',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                paper_bgcolor='rgba(255,255,255,0)',
+                height=500,
+                xaxis_title="Revenue ($)",
+                yaxis_title=""
+            )
+            st.plotly_chart(fig_products, use_container_width=True)
+        else:
+            st.info("No product data available")
+
+    with col2:
+        st.markdown("#### Top Rated Products")
+        reviews = get_all_dashboard_data()['product_reviews']
+        if not reviews.empty:
+            # Direct graph_objects build: skips plotly express's
+            # figure-construction layer, and Scattergl renders
+            # through WebGL instead of the SVG slow path
+            fig_ratings = go.Figure(go.Scattergl(
+                x=reviews['review_count'],
+                y=reviews['avg_rating'],
+                mode='markers',
+                marker=dict(
+                    size=reviews['avg_rating'] * 4,
+                    color=reviews['avg_rating'],
+                    colorscale='RdYlGn',
+                    showscale=True,
+                ),
+                text=reviews['product_name'],
+                hovertemplate='<b>%{text}</b><br>Reviews: %{x}<br>Rating: %{y}<extra></extra>',
+            ))
+            fig_ratings.update_layout(
+                template='plotly_white',
+                hovermode='closest',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                paper_bgcolor='rgba(255,255,255,0)',
+                height=500,
+                xaxis_title="Review Count",
+                yaxis_title="Average Rating"
+            )
+            st.plotly_chart(fig_ratings, use_container_width=True)
+        else:
+            st.info("No review data available")
+
+
+@st.fragment
+def page_customer_insights():
+    # Customer Insights Section
+    st.markdown("### 👥 Customer Insights", unsafe_allow_html=True)
+    customer_metrics = get_all_dashboard_data()['customer_metrics']
+
+    col1, col2, col3 = st.columns(3, gap="medium")
+    with col1:
+        st.metric(
+            label="👫 Total Customers",
+            value=f"{int(customer_metrics['total_customers']):,}",
+            delta="Active users"
+        )
+    with col2:
+        st.metric(
+            label="📦 Avg Orders per Customer",
+            value=f"{customer_metrics['avg_orders_per_customer']:.2f}",
+            delta="Per user"
+        )
+    with col3:
+        st.metric(
+            label="💳 Avg Spend per Customer",
+            value=f"${customer_metrics['avg_spend_per_customer']:,.2f}",
+            delta="Lifetime value"
+        )
+
+
+@st.fragment
+def page_category_analysis():
+    # Category Analysis Section
+    st.markdown("### 📦 Product Category Analysis", unsafe_allow_html=True)
+    category_data = get_category_analysis(db_mtime=_db_mtime())
+
+    if not category_data.empty:
+        col1, col2 = st.columns(2, gap="large")
+
+        with col1:
+            st.markdown("#### Revenue by Category")
+            fig_category = px.bar(
+                category_data,
+                x='category',
+                y='category_revenue',
+                color='category_revenue',
+                template='plotly_white',
+                color_continuous_scale='Blues'
+            )
+            fig_category.update_layout(
+                showlegend=False,
+                hovermode='x',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                paper_bgcolor='rgba(255,255,255,0)',
+                height=400,
+                xaxis_title="Category",
+                yaxis_title="Revenue ($)"
+            )
+            st.plotly_chart(fig_category, use_container_width=True)
+
+        with col2:
+            st.markdown("#### Category Metrics Table")
+            # set_axis shares the column buffers under copy-on-write
+            # instead of deep-copying the frame just to relabel it
+            display_df = category_data.set_axis(
+                ['Category', 'Products', 'Orders', 'Revenue', 'Avg Price', 'Units Sold'],
+                axis=1)
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No category data available")
+
+
+@st.fragment
+def page_customer_segmentation():
+    # Customer Segmentation Section
+    st.markdown("### 💼 Customer Segmentation", unsafe_allow_html=True)
+    segments = get_customer_segments(db_mtime=_db_mtime())
+
+    if not segments.empty:
+        col1, col2 = st.columns(2, gap="large")
+
+        with col1:
+            st.markdown("#### Customer Segments Distribution")
+            fig_segments = px.pie(
+                segments,
+                values='customer_count',
+                names='segment',
+                template='plotly_white',
+                color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
+            )
+            fig_segments.update_layout(
+                height=400,
+                showlegend=True
+            )
+            st.plotly_chart(fig_segments, use_container_width=True)
+
+        with col2:
+            st.markdown("#### Segment Revenue Analysis")
+            fig_seg_revenue = px.bar(
+                segments,
+                x='segment',
+                y='segment_revenue',
+                color='segment_revenue',
+                template='plotly_white',
+                color_continuous_scale='Greens'
+            )
+            fig_seg_revenue.update_layout(
+                showlegend=False,
+                hovermode='x',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                paper_bgcolor='rgba(255,255,255,0)',
+                height=400,
+                xaxis_title="Segment",
+                yaxis_title="Revenue ($)"
+            )
+            st.plotly_chart(fig_seg_revenue, use_container_width=True)
+    else:
+        st.info("No customer segmentation data available")
+
+
+@st.fragment
+def page_sales_trend_by_category():
+    # Sales by Category Trend
+    st.markdown("### 📈 Sales Trend by Category", unsafe_allow_html=True)
+    sales_category = get_sales_by_category(db_mtime=_db_mtime())
+
+    if not sales_category.empty:
+        # Downsample each category's series independently so no
+        # single series exceeds what the screen can resolve
+        sales_category = pd.concat(
+            [lttb_downsample(g, 'revenue')
+             for _, g in sales_category.groupby('category', sort=False)],
+            ignore_index=True,
+        )
+        # One Scattergl trace per category instead of letting
+        # plotly express melt and split the frame per trace
+        fig_sales_trend = go.Figure()
+        for category, g in sales_category.groupby('category', sort=False):
+            fig_sales_trend.add_trace(go.Scattergl(
+                x=g['month'],
+                y=g['revenue'],
+                mode='lines+markers',
+                name=str(category),
+            ))
+        fig_sales_trend.update_layout(
+            template='plotly_white',
+            hovermode='x unified',
+            plot_bgcolor='rgba(240, 240, 240, 0.5)',
+            paper_bgcolor='rgba(255,255,255,0)',
+            height=450,
+            xaxis_title="Month",
+            yaxis_title="Revenue ($)",
+            legend=dict(
+                title="Category",
+                yanchor="top",
+                y=0.99,
+                xanchor="left",
+                x=0.01
+            )
+        )
+        st.plotly_chart(fig_sales_trend, use_container_width=True)
+    else:
+        st.info("No sales trend data available")
+
+
+@st.fragment
+def page_top_customers():
+    # Top Customers Section
+    st.markdown("### 🌟 Top 10 Customers", unsafe_allow_html=True)
+    top_customers = get_top_customers(db_mtime=_db_mtime())
+
+    if not top_customers.empty:
+        fig_customers = px.bar(
+            top_customers,
+            x='total_spent',
+            y='name',
+            orientation='h',
+            template='plotly_white',
+            color='order_count',
+            color_continuous_scale='Oranges'
+        )
+        fig_customers.update_layout(
+            showlegend=True,
+            hovermode='y',
+            plot_bgcolor='rgba(240, 240, 240, 0.5)',
+            paper_bgcolor='rgba(255,255,255,0)',
+            height=500,
+            xaxis_title="Total Spent ($)",
+            yaxis_title="Customer",
+            coloraxis_colorbar=dict(title="Orders")
+        )
+        st.plotly_chart(fig_customers, use_container_width=True)
+    else:
+        st.info("No customer data available")
+
+
+@st.fragment
+def page_detailed_product_performance():
+    # Product Performance Detailed Analysis
+    st.markdown("### 🏆 Detailed Product Performance", unsafe_allow_html=True)
+    product_perf = get_product_performance(db_mtime=_db_mtime())
+
+    if not product_perf.empty:
+        st.markdown("#### Top 15 Products by Revenue with Full Metrics")
+        display_prod = product_perf.set_axis(
+            ['Product ID', 'Product', 'Category', 'Times Sold', 'Units Sold',
+             'Revenue', 'Avg Price', 'Rating'],
+            axis=1)
+        st.dataframe(display_prod, use_container_width=True, hide_index=True)
+
+        # Product scatter plot
+        st.markdown("#### Product Performance Scatter (Revenue vs Rating vs Units Sold)")
+        # Area-scaled marker sizes matching px's size_max=50
+        sizeref = 2.0 * float(product_perf['units_sold'].max() or 1) / (50 ** 2)
+        fig_prod = go.Figure()
+        for category, g in product_perf.groupby('category', sort=False):
+            fig_prod.add_trace(go.Scattergl(
+                x=g['total_revenue'],
+                y=g['avg_rating'],
+                mode='markers',
+                name=str(category),
+                marker=dict(
+                    size=g['units_sold'],
+                    sizemode='area',
+                    sizeref=sizeref,
+                    sizemin=4,
+                ),
+                text=g['product_name'],
+                hovertemplate='<b>%{text}</b><br>Revenue: %{x}<br>Rating: %{y}<extra></extra>',
+            ))
+        fig_prod.update_layout(
+            template='plotly_white',
+            hovermode='closest',
+            plot_bgcolor='rgba(240, 240, 240, 0.5)',
+            paper_bgcolor='rgba(255,255,255,0)',
+            height=450,
+            xaxis_title="Total Revenue ($)",
+            yaxis_title="Average Rating"
+        )
+        st.plotly_chart(fig_prod, use_container_width=True)
+    else:
+        st.info("No product performance data available")
+
+
+@st.fragment
+def page_user_demographics():
+    # User Demographics Section
+    st.markdown("### 👤 User Demographics", unsafe_allow_html=True)
+
+    # The three panels are independent - fetch them concurrently
+    gender_data, city_data, signup_data = parallel(
+        lambda: get_gender_distribution(db_mtime=_db_mtime()),
+        lambda: get_city_distribution(db_mtime=_db_mtime()),
+        lambda: get_signup_trends(db_mtime=_db_mtime()),
+    )
+
+    col1, col2, col3 = st.columns(3, gap="large")
+
+    with col1:
+        st.markdown("#### Gender Distribution")
+        if not gender_data.empty:
+            fig_gender = px.pie(
+                gender_data,
+                values='count',
+                names='gender',
+                template='plotly_white',
+                color_discrete_sequence=['#FF69B4', '#4169E1']
+            )
+            fig_gender.update_layout(
+                height=300,
+                showlegend=True
+            )
+            st.plotly_chart(fig_gender, use_container_width=True)
+        else:
+            st.info("No gender data available")
+
+    with col2:
+        st.markdown("#### Top 10 Cities by User Count")
+        if not city_data.empty:
+            fig_city = px.bar(
+                city_data,
+                x='user_count',
+                y='city',
+                orientation='h',
+                template='plotly_white',
+                color='user_count',
+                color_continuous_scale='Blues'
+            )
+            fig_city.update_layout(
+                showlegend=False,
+                hovermode='y',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                paper_bgcolor='rgba(255,255,255,0)',
+                height=300,
+                xaxis_title="User Count",
+                yaxis_title=""
+            )
+            st.plotly_chart(fig_city, use_container_width=True)
+        else:
+            st.info("No city data available")
+
+    with col3:
+        st.markdown("#### User Signup Trends")
+        if not signup_data.empty:
+            fig_signup = px.line(
+                signup_data,
+                x='month',
+                y='new_users',
+                template='plotly_white',
+                markers=True
+            )
+            fig_signup.update_traces(
+                line=dict(color='#667eea', width=3),
+                marker=dict(size=8, color='#764ba2')
+            )
+            fig_signup.update_layout(
+                hovermode='x unified',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                paper_bgcolor='rgba(255,255,255,0)',
+                height=300,
+                xaxis_title="Month",
+                yaxis_title="New Users"
+            )
+            st.plotly_chart(fig_signup, use_container_width=True)
+        else:
+            st.info("No signup data available")
+
+
+ANALYTICS_PAGES = {
+    "Revenue Trends": page_revenue_trends,
+    "Products Performance": page_products_performance,
+    "Customer Insights": page_customer_insights,
+    "Category Analysis": page_category_analysis,
+    "Customer Segmentation": page_customer_segmentation,
+    "Sales Trend by Category": page_sales_trend_by_category,
+    "Top Customers": page_top_customers,
+    "Detailed Product Performance": page_detailed_product_performance,
+    "User Demographics": page_user_demographics,
+}
+
+
 try:
     if page == "Overview":
         # KPIs Section
         st.markdown("### 📈 Key Performance Indicators", unsafe_allow_html=True)
-        kpis = get_kpis()
+        kpis = get_all_dashboard_data()['kpis']
 
         col1, col2, col3, col4 = st.columns(4, gap="medium")
         with col1:
@@ -565,374 +1739,9 @@ try:
             )
 
     elif page == "Analytics":
-        if analytics_option == "Revenue Trends":
-            # Revenue Trend Section
-            st.markdown("### 📊 Revenue Trend", unsafe_allow_html=True)
-            revenue_data = get_revenue_by_month()
-            if not revenue_data.empty:
-                fig_revenue = px.line(
-                    revenue_data,
-                    x='month',
-                    y='revenue',
-                    title='Monthly Revenue Trend',
-                    markers=True,
-                    line_shape='linear',
-                    template='plotly_white'
-                )
-                fig_revenue.update_traces(
-                    line=dict(color='#667eea', width=3),
-                    marker=dict(size=10, color='#764ba2')
-                )
-                fig_revenue.update_layout(
-                    hovermode='x unified',
-                    plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                    paper_bgcolor='rgba(255,255,255,0)',
-                    font=dict(size=12),
-                    height=400
-                )
-                st.plotly_chart(fig_revenue, use_container_width=True)
-            else:
-                st.info("No revenue data available")
-
-        elif analytics_option == "Products Performance":
-            # Products and Ratings Section
-            st.markdown("### 🏆 Products Performance", unsafe_allow_html=True)
-            col1, col2 = st.columns(2, gap="large")
-
-            with col1:
-                st.markdown("#### Top 10 Products by Revenue")
-                top_products = get_top_products()
-                if not top_products.empty:
-                    fig_products = px.bar(
-                        top_products,
-                        x='total_revenue',
-                        y='product_name',
-                        orientation='h',
-                        template='plotly_white',
-                        color='total_revenue',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig_products.update_layout(
-                        showlegend=False,
-                        hovermode='y',
-                        plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                        paper_bgcolor='rgba(255,255,255,0)',
-                        height=500,
-                        xaxis_title="Revenue ($)",
-                        yaxis_title=""
-                    )
-                    st.plotly_chart(fig_products, use_container_width=True)
-                else:
-                    st.info("No product data available")
-
-            with col2:
-                st.markdown("#### Top Rated Products")
-                reviews = get_product_reviews()
-                if not reviews.empty:
-                    fig_ratings = px.scatter(
-                        reviews,
-                        x='review_count',
-                        y='avg_rating',
-                        size='avg_rating',
-                        hover_name='product_name',
-                        template='plotly_white',
-                        color='avg_rating',
-                        color_continuous_scale='RdYlGn'
-                    )
-                    fig_ratings.update_layout(
-                        hovermode='closest',
-                        plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                        paper_bgcolor='rgba(255,255,255,0)',
-                        height=500,
-                        xaxis_title="Review Count",
-                        yaxis_title="Average Rating"
-                    )
-                    st.plotly_chart(fig_ratings, use_container_width=True)
-                else:
-                    st.info("No review data available")
-
-        elif analytics_option == "Customer Insights":
-            # Customer Insights Section
-            st.markdown("### 👥 Customer Insights", unsafe_allow_html=True)
-            customer_metrics = get_customer_metrics()
-
-            col1, col2, col3 = st.columns(3, gap="medium")
-            with col1:
-                st.metric(
-                    label="👫 Total Customers",
-                    value=f"{int(customer_metrics['total_customers']):,}",
-                    delta="Active users"
-                )
-            with col2:
-                st.metric(
-                    label="📦 Avg Orders per Customer",
-                    value=f"{customer_metrics['avg_orders_per_customer']:.2f}",
-                    delta="Per user"
-                )
-            with col3:
-                st.metric(
-                    label="💳 Avg Spend per Customer",
-                    value=f"${customer_metrics['avg_spend_per_customer']:,.2f}",
-                    delta="Lifetime value"
-                )
-
-        elif analytics_option == "Category Analysis":
-            # Category Analysis Section
-            st.markdown("### 📦 Product Category Analysis", unsafe_allow_html=True)
-            category_data = get_category_analysis()
-
-            if not category_data.empty:
-                col1, col2 = st.columns(2, gap="large")
-
-                with col1:
-                    st.markdown("#### Revenue by Category")
-                    fig_category = px.bar(
-                        category_data,
-                        x='category',
-                        y='category_revenue',
-                        color='category_revenue',
-                        template='plotly_white',
-                        color_continuous_scale='Blues'
-                    )
-                    fig_category.update_layout(
-                        showlegend=False,
-                        hovermode='x',
-                        plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                        paper_bgcolor='rgba(255,255,255,0)',
-                        height=400,
-                        xaxis_title="Category",
-                        yaxis_title="Revenue ($)"
-                    )
-                    st.plotly_chart(fig_category, use_container_width=True)
-
-                with col2:
-                    st.markdown("#### Category Metrics Table")
-                    display_df = category_data.copy()
-                    display_df.columns = ['Category', 'Products', 'Orders', 'Revenue', 'Avg Price', 'Units Sold']
-                    st.dataframe(display_df, use_container_width=True, hide_index=True)
-            else:
-                st.info("No category data available")
-
-        elif analytics_option == "Customer Segmentation":
-            # Customer Segmentation Section
-            st.markdown("### 💼 Customer Segmentation", unsafe_allow_html=True)
-            segments = get_customer_segments()
-
-            if not segments.empty:
-                col1, col2 = st.columns(2, gap="large")
-
-                with col1:
-                    st.markdown("#### Customer Segments Distribution")
-                    fig_segments = px.pie(
-                        segments,
-                        values='customer_count',
-                        names='segment',
-                        template='plotly_white',
-                        color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
-                    )
-                    fig_segments.update_layout(
-                        height=400,
-                        showlegend=True
-                    )
-                    st.plotly_chart(fig_segments, use_container_width=True)
-
-                with col2:
-                    st.markdown("#### Segment Revenue Analysis")
-                    fig_seg_revenue = px.bar(
-                        segments,
-                        x='segment',
-                        y='segment_revenue',
-                        color='segment_revenue',
-                        template='plotly_white',
-                        color_continuous_scale='Greens'
-                    )
-                    fig_seg_revenue.update_layout(
-                        showlegend=False,
-                        hovermode='x',
-                        plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                        paper_bgcolor='rgba(255,255,255,0)',
-                        height=400,
-                        xaxis_title="Segment",
-                        yaxis_title="Revenue ($)"
-                    )
-                    st.plotly_chart(fig_seg_revenue, use_container_width=True)
-            else:
-                st.info("No customer segmentation data available")
-
-        elif analytics_option == "Sales Trend by Category":
-            # Sales by Category Trend
-            st.markdown("### 📈 Sales Trend by Category", unsafe_allow_html=True)
-            sales_category = get_sales_by_category()
-
-            if not sales_category.empty:
-                fig_sales_trend = px.line(
-                    sales_category,
-                    x='month',
-                    y='revenue',
-                    color='category',
-                    template='plotly_white',
-                    markers=True
-                )
-                fig_sales_trend.update_layout(
-                    hovermode='x unified',
-                    plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                    paper_bgcolor='rgba(255,255,255,0)',
-                    height=450,
-                    xaxis_title="Month",
-                    yaxis_title="Revenue ($)",
-                    legend=dict(
-                        title="Category",
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="left",
-                        x=0.01
-                    )
-                )
-                st.plotly_chart(fig_sales_trend, use_container_width=True)
-            else:
-                st.info("No sales trend data available")
-
-        elif analytics_option == "Top Customers":
-            # Top Customers Section
-            st.markdown("### 🌟 Top 10 Customers", unsafe_allow_html=True)
-            top_customers = get_top_customers()
-
-            if not top_customers.empty:
-                fig_customers = px.bar(
-                    top_customers,
-                    x='total_spent',
-                    y='name',
-                    orientation='h',
-                    template='plotly_white',
-                    color='order_count',
-                    color_continuous_scale='Oranges'
-                )
-                fig_customers.update_layout(
-                    showlegend=True,
-                    hovermode='y',
-                    plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                    paper_bgcolor='rgba(255,255,255,0)',
-                    height=500,
-                    xaxis_title="Total Spent ($)",
-                    yaxis_title="Customer",
-                    coloraxis_colorbar=dict(title="Orders")
-                )
-                st.plotly_chart(fig_customers, use_container_width=True)
-            else:
-                st.info("No customer data available")
-
-        elif analytics_option == "Detailed Product Performance":
-            # Product Performance Detailed Analysis
-            st.markdown("### 🏆 Detailed Product Performance", unsafe_allow_html=True)
-            product_perf = get_product_performance()
-
-            if not product_perf.empty:
-                st.markdown("#### Top 15 Products by Revenue with Full Metrics")
-                display_prod = product_perf.copy()
-                display_prod.columns = ['Product ID', 'Product', 'Category', 'Times Sold', 'Units Sold', 'Revenue', 'Avg Price', 'Rating']
-                st.dataframe(display_prod, use_container_width=True, hide_index=True)
-
-                # Product scatter plot
-                st.markdown("#### Product Performance Scatter (Revenue vs Rating vs Units Sold)")
-                fig_prod = px.scatter(
-                    product_perf,
-                    x='total_revenue',
-                    y='avg_rating',
-                    size='units_sold',
-                    hover_name='product_name',
-                    color='category',
-                    template='plotly_white',
-                    size_max=50
-                )
-                fig_prod.update_layout(
-                    hovermode='closest',
-                    plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                    paper_bgcolor='rgba(255,255,255,0)',
-                    height=450,
-                    xaxis_title="Total Revenue ($)",
-                    yaxis_title="Average Rating"
-                )
-                st.plotly_chart(fig_prod, use_container_width=True)
-            else:
-                st.info("No product performance data available")
-
-        elif analytics_option == "User Demographics":
-            # User Demographics Section
-            st.markdown("### 👤 User Demographics", unsafe_allow_html=True)
-
-            col1, col2, col3 = st.columns(3, gap="large")
-
-            with col1:
-                st.markdown("#### Gender Distribution")
-                gender_data = get_gender_distribution()
-                if not gender_data.empty:
-                    fig_gender = px.pie(
-                        gender_data,
-                        values='count',
-                        names='gender',
-                        template='plotly_white',
-                        color_discrete_sequence=['#FF69B4', '#4169E1']
-                    )
-                    fig_gender.update_layout(
-                        height=300,
-                        showlegend=True
-                    )
-                    st.plotly_chart(fig_gender, use_container_width=True)
-                else:
-                    st.info("No gender data available")
-
-            with col2:
-                st.markdown("#### Top 10 Cities by User Count")
-                city_data = get_city_distribution()
-                if not city_data.empty:
-                    fig_city = px.bar(
-                        city_data,
-                        x='user_count',
-                        y='city',
-                        orientation='h',
-                        template='plotly_white',
-                        color='user_count',
-                        color_continuous_scale='Blues'
-                    )
-                    fig_city.update_layout(
-                        showlegend=False,
-                        hovermode='y',
-                        plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                        paper_bgcolor='rgba(255,255,255,0)',
-                        height=300,
-                        xaxis_title="User Count",
-                        yaxis_title=""
-                    )
-                    st.plotly_chart(fig_city, use_container_width=True)
-                else:
-                    st.info("No city data available")
-
-            with col3:
-                st.markdown("#### User Signup Trends")
-                signup_data = get_signup_trends()
-                if not signup_data.empty:
-                    fig_signup = px.line(
-                        signup_data,
-                        x='month',
-                        y='new_users',
-                        template='plotly_white',
-                        markers=True
-                    )
-                    fig_signup.update_traces(
-                        line=dict(color='#667eea', width=3),
-                        marker=dict(size=8, color='#764ba2')
-                    )
-                    fig_signup.update_layout(
-                        hovermode='x unified',
-                        plot_bgcolor='rgba(240, 240, 240, 0.5)',
-                        paper_bgcolor='rgba(255,255,255,0)',
-                        height=300,
-                        xaxis_title="Month",
-                        yaxis_title="New Users"
-                    )
-                    st.plotly_chart(fig_signup, use_container_width=True)
-                else:
-                    st.info("No signup data available")
+        page_fn = ANALYTICS_PAGES.get(analytics_option)
+        if page_fn is not None:
+            page_fn()
 
     # Footer
     st.markdown("""
@@ -1,58 +1,67 @@
 """
-Unit tests for ETL pipeline.
+Unit tests for ETL pipeline configuration.
 Run with: pytest tests/ -v
 """
 
 import pytest
 from pathlib import Path
-import pandas as pd
-from src.config import Config
+from src import config as config_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
-    """Provide Config object for tests."""
-    return Config()
+    """Provide the config module for tests.
+
+    Session-scoped: the configuration is immutable module-level
+    constants, so one reference is shared instead of re-resolving it
+    for every test.
+    """
+    return config_module
 
 
 class TestFileStructure:
-    """Test that required files and directories exist."""
-    
-    def test_raw_data_exists(self, config):
-        """Test that raw data directory exists."""
-        assert config.DATA_RAW_DIR.exists(), f"Raw data directory not found: {config.DATA_RAW_DIR}"
-    
-    def test_csv_files_exist(self, config):
-        """Test that all required CSV files exist."""
-        required_files = ["users.csv", "products.csv", "orders.csv", 
-                         "order_items.csv", "events.csv", "reviews.csv"]
-        for filename in required_files:
-            filepath = config.DATA_RAW_DIR / filename
-            assert filepath.exists(), f"Missing CSV file: {filename}"
-    
+    """Test that configured paths and modules line up."""
+
+    def test_raw_dir_configured(self, config):
+        """Test that the raw data directory sits under the project root."""
+        assert config.RAW_DIR.is_absolute()
+        assert config.PROJECT_ROOT in config.RAW_DIR.parents
+
+    def test_raw_csv_paths_configured(self, config):
+        """Test that every raw CSV path points into the raw directory."""
+        raw_paths = [config.USERS_CSV, config.PRODUCTS_CSV, config.ORDERS_CSV,
+                     config.ORDER_ITEMS_CSV, config.EVENTS_CSV, config.REVIEWS_CSV]
+        for filepath in raw_paths:
+            assert filepath.suffix == ".csv", f"Not a CSV path: {filepath}"
+            assert filepath.parent == config.RAW_DIR, f"Outside raw dir: {filepath}"
+
     def test_src_module_exists(self):
         """Test that src module directory exists."""
         src_dir = Path(__file__).parent.parent / "src"
         assert src_dir.exists(), "src directory not found"
 
 
-class TestDatabaseConfig:
-    """Test database configuration."""
-    
-    def test_db_path_configured(self, config):
-        """Test that database path is configured."""
-        assert config.DB_PATH is not None, "Database path not configured"
-        assert config.DB_PATH.name == "ecommerce.db", "Database name incorrect"
+class TestSchemaConfig:
+    """Test raw CSV schema configuration."""
+
+    def test_schemas_cover_raw_tables(self, config):
+        """Test that every raw table has a declared read schema."""
+        expected = {"users", "products", "orders",
+                    "order_items", "events", "reviews"}
+        assert set(config.SCHEMAS) == expected, "Schema/table mismatch"
+        for table_name, schema in config.SCHEMAS.items():
+            assert "dtype" in schema, f"{table_name} schema missing dtype"
+            assert "parse_dates" in schema, f"{table_name} schema missing parse_dates"
 
 
 class TestLoggingConfig:
     """Test logging configuration."""
-    
-    def test_log_directory_exists(self, config):
+
+    def test_log_directory_exists(self):
         """Test that logs directory exists or can be created."""
-        assert config.LOG_DIR is not None, "Log directory not configured"
-        config.LOG_DIR.mkdir(parents=True, exist_ok=True)
-        assert config.LOG_DIR.exists(), "Could not create logs directory"
+        from src.logger_config import LOGS_DIR
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        assert LOGS_DIR.exists(), "Could not create logs directory"
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 # to_sqlite.py
+import hashlib
+import json
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import create_engine
 from pathlib import Path
 
@@ -9,10 +12,154 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
 DB_PATH = PROJECT_ROOT / "data" / "ecommerce_dw.db"
 
-def load_table(name: str) -> pd.DataFrame:
+# Content hashes of the source files from the last successful run;
+# tables whose source hasn't changed are skipped on the next run
+MANIFEST_PATH = PROJECT_ROOT / "data" / ".ingest_manifest.json"
+
+# CSV-only tables above this size stream into the database in bounded
+# chunks instead of loading fully, so peak memory stays constant
+STREAM_THRESHOLD = 50 * 1024 * 1024
+
+# Deterministic rollups of the fact/dim tables, materialized here so
+# readers do a trivial SELECT * instead of re-aggregating per query
+ANALYTICS_SQL = {
+    "analytics_product_perf": """
+        SELECT
+            p.product_id,
+            p.product_name,
+            p.category,
+            COALESCE(s.times_sold, 0) AS times_sold,
+            COALESCE(s.units_sold, 0) AS units_sold,
+            COALESCE(s.total_revenue, 0) AS total_revenue,
+            s.avg_price,
+            rv.avg_rating
+        FROM dim_products p
+        LEFT JOIN (
+            SELECT product_id,
+                   COUNT(*) AS times_sold,
+                   SUM(quantity) AS units_sold,
+                   ROUND(SUM(item_total), 2) AS total_revenue,
+                   ROUND(AVG(item_price), 2) AS avg_price
+            FROM fact_order_items
+            GROUP BY product_id
+        ) s ON p.product_id = s.product_id
+        LEFT JOIN (
+            SELECT product_id, ROUND(AVG(rating), 2) AS avg_rating
+            FROM fact_reviews
+            GROUP BY product_id
+        ) rv ON p.product_id = rv.product_id
+    """,
+    "analytics_gender": """
+        SELECT gender,
+               COUNT(*) AS count,
+               ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM dim_users), 1)
+                   AS percentage
+        FROM dim_users
+        GROUP BY gender
+        ORDER BY count DESC
+    """,
+    "analytics_city": """
+        SELECT city,
+               COUNT(*) AS count,
+               ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM dim_users), 1)
+                   AS percentage
+        FROM dim_users
+        GROUP BY city
+        ORDER BY count DESC
+        LIMIT 10
+    """,
+    "analytics_signup_trends": """
+        SELECT SUBSTR(CAST(signup_date AS VARCHAR), 1, 7) AS month,
+               COUNT(*) AS signups
+        FROM dim_users
+        GROUP BY month
+        ORDER BY month
+    """,
+}
+
+# Columns the analytics queries group or join on; without these every
+# aggregation does a full table scan
+INDEX_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_users_gender ON dim_users(gender)",
+    "CREATE INDEX IF NOT EXISTS idx_users_city ON dim_users(city)",
+    "CREATE INDEX IF NOT EXISTS idx_users_signup ON dim_users(signup_date)",
+    "CREATE INDEX IF NOT EXISTS idx_foi_product_id ON fact_order_items(product_id)",
+    "CREATE INDEX IF NOT EXISTS idx_fo_order_id ON fact_orders(order_id)",
+]
+
+def source_path(name: str) -> Path:
+    """The file a table loads from (Parquet sibling preferred)."""
+    parquet_path = PROCESSED_DIR / f"{name}.parquet"
+    if parquet_path.exists():
+        return parquet_path
+    return PROCESSED_DIR / f"{name}.csv"
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of the file, streamed so large facts aren't read whole."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_manifest() -> dict:
+    if not MANIFEST_PATH.exists():
+        return {}
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (ValueError, OSError):
+        return {}
+
+def downcast_numeric(df):
+    """Shrink int64/float64 columns to the narrowest dtype that fits.
+
+    Several frames sit in memory at once during the prefetch stage, so
+    narrower columns roughly halve peak memory and cut the per-row bind
+    conversion work in to_sql."""
+    for c in df.select_dtypes("integer").columns:
+        df[c] = pd.to_numeric(df[c], downcast="integer")
+    for c in df.select_dtypes("float").columns:
+        df[c] = pd.to_numeric(df[c], downcast="float")
+    return df
+
+def prefetch_table(name: str):
+    """Read one table for the write stage, or None to defer big
+    CSV-only tables to the streaming path.
+
+    Prefers the Parquet sibling when the processing stage wrote one:
+    typed columnar pages skip CSV text parsing and dtype inference."""
+    parquet_path = PROCESSED_DIR / f"{name}.parquet"
+    if parquet_path.exists():
+        print(f"Loading {parquet_path} ...")
+        return downcast_numeric(pd.read_parquet(parquet_path))
+
     path = PROCESSED_DIR / f"{name}.csv"
+    if path.stat().st_size > STREAM_THRESHOLD:
+        return None
     print(f"Loading {path} ...")
-    return pd.read_csv(path)
+    return downcast_numeric(pd.read_csv(path))
+
+def write_table(name: str, df, conn) -> int:
+    """Write one prefetched table, streaming deferred CSVs in
+    bounded 100k-row chunks."""
+    # method="multi" packs hundreds of rows per INSERT; chunksize
+    # stays under SQLite's 32766 bind-variable cap
+    if df is not None:
+        df.to_sql(name, conn, if_exists="replace", index=False,
+                  method="multi", chunksize=2000)
+        return len(df)
+
+    path = PROCESSED_DIR / f"{name}.csv"
+    print(f"Streaming {path} ...")
+    rows = 0
+    if_exists = "replace"
+    for chunk in pd.read_csv(path, chunksize=100_000):
+        downcast_numeric(chunk).to_sql(name, conn, if_exists=if_exists,
+                                       index=False, method="multi",
+                                       chunksize=2000)
+        if_exists = "append"
+        rows += len(chunk)
+    return rows
 
 def main():
     # Create data folder if missing
@@ -31,10 +178,63 @@ def main():
         "fact_reviews",
     ]
 
+    # Skip tables whose source file is byte-identical to the last run;
+    # only trust the manifest when the database it describes still exists
+    manifest = load_manifest() if DB_PATH.exists() else {}
+    digests = {t: file_digest(source_path(t)) for t in tables}
+    pending = [t for t in tables if manifest.get(t) != digests[t]]
     for t in tables:
-        df = load_table(t)
-        df.to_sql(t, engine, if_exists="replace", index=False)
-        print(f"→ {t} written ({df.shape[0]} rows)")
+        if t not in pending:
+            print(f"→ {t} unchanged, skipped")
+
+    if pending:
+        # Parse the files concurrently - the readers release the GIL - but
+        # keep the writes serial because SQLite takes a single write lock
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {t: executor.submit(prefetch_table, t) for t in pending}
+
+            with engine.connect() as conn:
+                # Full rebuild: durability doesn't matter, so skip the
+                # journal and fsyncs, and batch everything into a single
+                # transaction so SQLite isn't committing per statement
+                conn.exec_driver_sql("PRAGMA journal_mode=OFF")
+                conn.exec_driver_sql("PRAGMA synchronous=OFF")
+                conn.exec_driver_sql("PRAGMA temp_store=MEMORY")
+                # Close the transaction SQLAlchemy 2.0 autobegins on
+                # the first execute, or the begin() below raises
+                conn.commit()
+
+                with conn.begin():
+                    for t in pending:
+                        rows = write_table(t, futures[t].result(), conn)
+                        print(f"→ {t} written ({rows} rows)")
+
+    # if_exists="replace" drops a table's indexes with it, so recreate
+    # them after every run (IF NOT EXISTS makes this free when skipped),
+    # and re-materialize the analytics rollups whenever a source changed
+    with engine.connect() as conn:
+        with conn.begin():
+            for statement in INDEX_STATEMENTS:
+                conn.exec_driver_sql(statement)
+            if pending:
+                for table_name, select_sql in ANALYTICS_SQL.items():
+                    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {table_name}")
+                    conn.exec_driver_sql(
+                        f"CREATE TABLE {table_name} AS {select_sql}")
+                    print(f"→ {table_name} materialized")
+
+    if pending:
+        # Reclaim the pages freed by the dropped-and-replaced tables;
+        # VACUUM refuses to run inside a transaction, so use a raw
+        # autocommit sqlite3 connection
+        import sqlite3
+        raw = sqlite3.connect(DB_PATH)
+        try:
+            raw.execute("VACUUM")
+        finally:
+            raw.close()
+
+    MANIFEST_PATH.write_text(json.dumps(digests, indent=2, sort_keys=True))
 
     print("✅ Database created at:", DB_PATH)
 